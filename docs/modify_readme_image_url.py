@@ -3,6 +3,6 @@ from __future__ import annotations
 import pathlib
 
 if __name__ == "__main__":
-    content = pathlib.Path("README.md").read_text()
-    content = content.replace("/docs/images", "images")
-    pathlib.Path("README_tmp.md").write_text(content)
+    content = pathlib.Path("README.md").read_bytes()
+    content = content.replace(b"/docs/images", b"images")
+    pathlib.Path("README_tmp.md").write_bytes(content)
@@ -24,9 +24,10 @@ Overview of the MockCurvesXRange for load case Dummy
 
 from __future__ import annotations
 
-from vimseo import EXAMPLE_RUNS_DIR_NAME
 from vimseo.api import create_model
 from vimseo.core.model_settings import IntegratedModelSettings
+from vimseo.utilities.doc.gallery_utils import SHOW
+from vimseo.utilities.doc.gallery_utils import get_run_paths
 
 # %%
 # First, let's instantiate the model for a given load case:
@@ -38,9 +39,7 @@ model = create_model(
     load_case,
     check_subprocess=True,
     model_options=IntegratedModelSettings(
-        directory_archive_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/archive/model_gallery",
-        directory_scratch_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/scratch/model_gallery",
-        cache_file_path=f"../../../{EXAMPLE_RUNS_DIR_NAME}/caches/model_gallery/{model_name}_{load_case}_cache.hdf",
+        **get_run_paths("model_gallery", model_name, load_case)
     ),
 )
 
@@ -62,7 +61,7 @@ model.execute()
 # %%
 # And the results are visualised with the pre-defined plots:
 
-figures = model.plot_results(show=True)
+figures = model.plot_results(show=SHOW)
 
 
 # %%
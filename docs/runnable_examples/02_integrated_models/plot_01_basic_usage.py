@@ -36,10 +36,11 @@ import logging
 from gemseo.core.discipline import Discipline
 from numpy import array
 
-from vimseo import EXAMPLE_RUNS_DIR_NAME
 from vimseo.api import activate_logger
 from vimseo.api import create_model
 from vimseo.core.model_settings import IntegratedModelSettings
+from vimseo.utilities.doc.gallery_utils import SHOW
+from vimseo.utilities.doc.gallery_utils import get_run_paths
 
 activate_logger(level=logging.INFO)
 
@@ -58,9 +59,7 @@ model = create_model(
     model_name,
     load_case,
     model_options=IntegratedModelSettings(
-        directory_archive_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/archive/basic_usage",
-        directory_scratch_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/scratch/basic_usage",
-        cache_file_path=f"../../../{EXAMPLE_RUNS_DIR_NAME}/caches/basic_usage/{model_name}_{load_case}_cache.hdf",
+        **get_run_paths("basic_usage", model_name, load_case)
     ),
 )
 model.set_cache(Discipline.CacheType.NONE)
@@ -129,7 +128,7 @@ model.get_output_data()["maximum_dplt"]
 # %%
 # And the outputs plotted like this:
 
-figures = model.plot_results(save=True, show=True)
+figures = model.plot_results(save=True, show=SHOW)
 
 figures["dplt_vs_dplt_grid"]
 
@@ -149,7 +148,7 @@ print(output_data)
 # The outputs can be plotted again. Note that the displcement curve support
 # now corresponds to +/- 0.3 times the half length of the beam:
 
-figures = model.plot_results(show=True)
+figures = model.plot_results(show=SHOW)
 
 figures["dplt_vs_dplt_grid"]
 
@@ -40,11 +40,12 @@ from numpy import atleast_1d
 from pandas import DataFrame
 from pandas import concat
 
-from vimseo import EXAMPLE_RUNS_DIR_NAME
 from vimseo.api import activate_logger
 from vimseo.api import create_model
 from vimseo.core.model_result import ModelResult
 from vimseo.core.model_settings import IntegratedModelSettings
+from vimseo.utilities.doc.gallery_utils import SHOW
+from vimseo.utilities.doc.gallery_utils import get_run_paths
 from vimseo.utilities.plotting_utils import plot_curves
 
 activate_logger(level=logging.INFO)
@@ -58,9 +59,7 @@ model = create_model(
     model_name,
     load_case,
     model_options=IntegratedModelSettings(
-        directory_archive_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/archive/visualize_model_result",
-        directory_scratch_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/scratch/visualize_model_result",
-        cache_file_path=f"../../../{EXAMPLE_RUNS_DIR_NAME}/caches/visualize_model_result/{model_name}_{load_case}_cache.hdf",
+        **get_run_paths("visualize_model_result", model_name, load_case)
     ),
 )
 model.cache = None
@@ -70,7 +69,7 @@ result = ModelResult.from_data({
     "inputs": model.get_input_data(),
     "outputs": model.get_output_data(),
 })
-figs = model.plot_results(show=True, save=False)
+figs = model.plot_results(show=SHOW, save=False)
 figs["dplt_vs_dplt_grid"]
 
 # %%
@@ -79,7 +78,7 @@ figs["moment_vs_moment_grid"]
 # %%
 # Scalar outputs can be visualized in a scatter matrix:
 figs = model.plot_results(
-    show=True,
+    show=SHOW,
     save=True,
     data="SCALARS",
     scalar_names=["young_modulus", "reaction_forces"],
@@ -122,7 +121,7 @@ plot = ScatterMatrix(Dataset.from_dataframe(df), coloring_variable="color")
 plot.labels = ["result", "result 1"]
 fig = plot.execute(
     save=False,
-    show=True,
+    show=SHOW,
 )
 fig
 
@@ -170,7 +169,7 @@ plot = BarPlot(Dataset.from_dataframe(df))
 plot.title = "Comparison of model result with data"
 plot.font_size = 20
 plot.labels = ["data", "model result"]
-fig = plot.execute(save=True, show=True, file_format="html")[0]
+fig = plot.execute(save=True, show=SHOW, file_format="html")[0]
 fig
 
 # %%
@@ -182,6 +181,6 @@ plot = ScatterMatrix(Dataset.from_dataframe(df), coloring_variable="color")
 plot.labels = ["data", "model result"]
 fig = plot.execute(
     save=False,
-    show=True,
+    show=SHOW,
 )
 fig
@@ -41,12 +41,14 @@ from numpy import atleast_1d
 from pandas import DataFrame
 from pandas import concat
 
-from vimseo import EXAMPLE_RUNS_DIR_NAME
 from vimseo.api import activate_logger
 from vimseo.api import create_model
 from vimseo.core.model_result import ModelResult
 from vimseo.core.model_settings import IntegratedModelSettings
 from vimseo.storage_management.base_storage_manager import PersistencyPolicy
+from vimseo.utilities.doc.gallery_utils import EXAMPLE_RUNS_DIR
+from vimseo.utilities.doc.gallery_utils import SHOW
+from vimseo.utilities.doc.gallery_utils import get_run_paths
 from vimseo.utilities.plotting_utils import plot_curves
 
 activate_logger(level=logging.INFO)
@@ -90,10 +92,8 @@ model = create_model(
     model_name,
     load_case,
     IntegratedModelSettings(
+        **get_run_paths("visualize_model_result", model_name, load_case),
         directory_scratch_persistency=PersistencyPolicy.DELETE_NEVER,
-        directory_archive_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/archive/visualize_model_result",
-        directory_scratch_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/scratch/visualize_model_result",
-        cache_file_path=f"../../../{EXAMPLE_RUNS_DIR_NAME}/caches/visualize_model_result/{model_name}_{load_case}_cache.hdf",
     ),
 )
 model.archive_manager._accept_overwrite_job_dir = True
@@ -129,9 +129,9 @@ model = create_model(
     model_name,
     load_case,
     model_options=IntegratedModelSettings(
-        directory_archive_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/mlflow_archive/visualize_model_result",
-        directory_scratch_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/scratch/visualize_model_result",
-        cache_file_path=f"../../../{EXAMPLE_RUNS_DIR_NAME}/caches/visualize_model_result/{model_name}_{load_case}_cache.hdf",
+        directory_archive_root=f"{EXAMPLE_RUNS_DIR}/mlflow_archive/visualize_model_result",
+        directory_scratch_root=f"{EXAMPLE_RUNS_DIR}/scratch/visualize_model_result",
+        cache_file_path=f"{EXAMPLE_RUNS_DIR}/caches/visualize_model_result/{model_name}_{load_case}_cache.hdf",
         archive_manager="MlflowArchive",
     ),
 )
@@ -228,7 +228,7 @@ plot_curves(
     ],
     labels=["result", "result 1"],
     save=False,
-    show=True,
+    show=SHOW,
 )
 
 # %%
@@ -245,5 +245,5 @@ plot = BarPlot(Dataset.from_dataframe(df))
 plot.title = "Comparison of model result with data"
 plot.font_size = 20
 plot.labels = ["height 50mm", "height 60mm"]
-fig = plot.execute(save=False, show=True, file_format="html")[0]
+fig = plot.execute(save=False, show=SHOW, file_format="html")[0]
 fig
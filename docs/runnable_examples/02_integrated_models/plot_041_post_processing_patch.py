@@ -24,6 +24,8 @@ The cache of the existing model is reused while running the composed model.
 
 from __future__ import annotations
 
+from itertools import chain
+
 from numpy import atleast_1d
 
 from vimseo.api import create_model
@@ -44,7 +46,7 @@ class MyPost(PostProcessor):
     def __init__(self, **options):
         super().__init__(**options)
         self.input_grammar.update_from_names(
-            list(model.output_grammar.names) + list(model.input_grammar.names)
+            chain(model.output_grammar.names, model.input_grammar.names)
         )
         self.output_grammar.update_from_data({"relative_max_dplt": atleast_1d(0.0)})
 
@@ -94,14 +94,11 @@ print(transformed_input_model.get_output_data())
 
 # %%
 # And check for correctness of the transformations:
-assert (
-    transformed_input_model._chain.disciplines[1].get_input_data()["length"]
-    == 2 * transformed_input_model.get_input_data()["width"]
-)
+pre_input_data = transformed_input_model._chain.disciplines[1].get_input_data()
+post_output_data = transformed_input_model._chain.disciplines[-2].get_output_data()
+input_data = transformed_input_model.get_input_data()
+assert pre_input_data["length"] == 2 * input_data["width"]
 assert (
     output_data["dplt_adim_at_force"]
-    == transformed_input_model._chain.disciplines[-2].get_output_data()[
-        "dplt_at_force_location"
-    ]
-    / transformed_input_model._chain.disciplines[1].get_input_data()["length"]
+    == post_output_data["dplt_at_force_location"] / pre_input_data["length"]
 )
@@ -28,12 +28,15 @@ import logging
 
 from gemseo.datasets.io_dataset import IODataset
 from gemseo.utils.directory_creator import DirectoryNamingMethod
+from numpy import array
+from numpy import float64
 
-from vimseo import EXAMPLE_RUNS_DIR_NAME
 from vimseo.api import activate_logger
 from vimseo.api import create_model
 from vimseo.core.model_settings import IntegratedModelSettings
 from vimseo.tools.verification.verification_vs_data import CodeVerificationAgainstData
+from vimseo.utilities.doc.gallery_utils import SHOW
+from vimseo.utilities.doc.gallery_utils import get_run_paths
 
 # %%
 # We first define the logger level:
@@ -47,18 +50,15 @@ model = create_model(
     model_name,
     load_case,
     model_options=IntegratedModelSettings(
-        directory_archive_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/archive/verification_vs_data",
-        directory_scratch_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/scratch/verification_vs_data",
-        cache_file_path=f"../../../{EXAMPLE_RUNS_DIR_NAME}/caches/verification_vs_data/{model_name}_{load_case}_cache.hdf",
+        **get_run_paths("verification_vs_data", model_name, load_case)
     ),
 )
 
 # %%
 # We also need a reference dataset.
 # Here we do it programmatically, but we can also create it from a csv file:
-# ``
 reference_data = IODataset().from_array(
-    data=[[10.0, 10.0, -4.0, -12.0], [15.0, 10.0, -6.0, -40.0]],
+    data=array([[10.0, 10.0, -4.0, -12.0], [15.0, 10.0, -6.0, -40.0]], dtype=float64),
     variable_names=["height", "width", "maximum_dplt", "reaction_forces"],
     variable_names_to_group_names={
         "height": "inputs",
@@ -116,7 +116,7 @@ figures = verificator.plot_results(
     "RelativeErrorMetric",
     "reaction_forces",
     save=False,
-    show=True,
+    show=SHOW,
     directory_path=verificator.working_directory,
 )
 
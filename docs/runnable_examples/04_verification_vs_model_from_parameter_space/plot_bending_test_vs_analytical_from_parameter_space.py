@@ -25,10 +25,10 @@ space."""
 from __future__ import annotations
 
 import logging
+from types import MappingProxyType
 
 from gemseo.utils.directory_creator import DirectoryNamingMethod
 
-from vimseo import EXAMPLE_RUNS_DIR_NAME
 from vimseo.api import activate_logger
 from vimseo.api import create_model
 from vimseo.core.model_settings import IntegratedModelSettings
@@ -36,6 +36,8 @@ from vimseo.tools.space.space_tool import SpaceTool
 from vimseo.tools.verification.verification_vs_model_from_parameter_space import (
     CodeVerificationAgainstModelFromParameterSpace,
 )
+from vimseo.utilities.doc.gallery_utils import SHOW
+from vimseo.utilities.doc.gallery_utils import get_run_paths
 
 # %%
 # We first define the logger level:
@@ -46,22 +48,24 @@ activate_logger(level=logging.INFO)
 # So we need to generate a space of parameters.
 # It is obtained using the ``SpaceTool`` and choosing the ``FromModelCenterAndCov``
 # builder.
+MINIMUM_VALUES = MappingProxyType({
+    "length": 200.0,
+    "height": 5.0,
+    "imposed_dplt": 0.0,
+    "relative_dplt_location": 0.1,
+})
+MAXIMUM_VALUES = MappingProxyType({
+    "length": 1000.0,
+    "height": 50.0,
+    "imposed_dplt": 20.0,
+    "relative_dplt_location": 1.0,
+})
 space_tool = SpaceTool(working_directory="SpaceTool_results")
 space_tool.execute(
     distribution_name="OTTriangularDistribution",
     space_builder_name="FromMinAndMax",
-    minimum_values={
-        "length": 200.0,
-        "height": 5.0,
-        "imposed_dplt": 0.0,
-        "relative_dplt_location": 0.1,
-    },
-    maximum_values={
-        "length": 1000.0,
-        "height": 50.0,
-        "imposed_dplt": 20.0,
-        "relative_dplt_location": 1.0,
-    },
+    minimum_values=dict(MINIMUM_VALUES),
+    maximum_values=dict(MAXIMUM_VALUES),
 )
 print(space_tool.parameter_space)
 
@@ -73,21 +77,17 @@ load_case = "Cantilever"
 model = create_model(
     model_name,
     load_case,
-    model_options=IntegratedModelSettings(
-        directory_archive_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/archive/verification_vs_model",
-        directory_scratch_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/scratch/verification_vs_model",
-    ),
+    model_options=IntegratedModelSettings(**get_run_paths("verification_vs_model")),
 )
 model.cache = None
 
 # %%
 # And the reference model:
 model_2 = create_model(
-    "BendingTestAnalytical",
+    model_name,
     load_case,
     model_options=IntegratedModelSettings(
-        directory_archive_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/archive/verification_vs_model_2nd_model",
-        directory_scratch_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/scratch/verification_vs_model_2nd_model",
+        **get_run_paths("verification_vs_model_2nd_model")
     ),
 )
 model_2.cache = None
@@ -144,7 +144,7 @@ figures = verificator.plot_results(
     "RelativeErrorMetric",
     "reaction_forces",
     save=False,
-    show=True,
+    show=SHOW,
     directory_path=verificator.working_directory,
 )
 
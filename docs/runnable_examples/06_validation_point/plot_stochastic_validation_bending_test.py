@@ -27,7 +27,6 @@ from pathlib import Path
 from gemseo.datasets.io_dataset import IODataset
 from pandas import read_csv
 
-from vimseo import EXAMPLE_RUNS_DIR_NAME
 from vimseo.api import activate_logger
 from vimseo.api import create_model
 from vimseo.core.model_settings import IntegratedModelSettings
@@ -42,6 +41,8 @@ from vimseo.tools.validation.validation_point import StochasticValidationPointIn
 from vimseo.tools.validation.validation_point import StochasticValidationPointSettings
 from vimseo.tools.validation.validation_point import read_nominal_values
 from vimseo.utilities.datasets import SEP
+from vimseo.utilities.doc.gallery_utils import SHOW
+from vimseo.utilities.doc.gallery_utils import get_run_paths
 from vimseo.utilities.generate_validation_reference import Bias
 from vimseo.utilities.generate_validation_reference import (
     generate_reference_from_parameter_space,
@@ -87,9 +88,7 @@ model = create_model(
     model_name,
     load_case,
     model_options=IntegratedModelSettings(
-        directory_archive_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/archive/validation_point",
-        directory_scratch_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/scratch/validation_point",
-        cache_file_path=f"../../../{EXAMPLE_RUNS_DIR_NAME}/caches/validation_point/{model_name}_{load_case}_cache.hdf",
+        **get_run_paths("validation_point", model_name, load_case)
     ),
 )
 
@@ -110,18 +109,20 @@ measured_outputs = ["reaction_forces"]
 batch = 1
 
 # %%
-# Then we define the path to the reference data
-csv_path = "reference_validation_bending_test_cantilever.csv"
+# Then we read the reference data once:
+df = read_csv(
+    "reference_validation_bending_test_cantilever.csv", delimiter=SEP, engine="pyarrow"
+)
 
 # %%
-# and the nominal inputs
+# and define the nominal inputs
 # at which the validation point is performed.
 # The ``read_nominal_values`` function allows to read
 # the nominal values in the reference data, using averaging
 # over the repeats for a given ``master`` variable:
 nominal_values = read_nominal_values(
     "batch",
-    csv_path=csv_path,
+    df=df,
     master_value=batch,
     additional_names=["nominal_length"],
     name_remapping={"nominal_length": "length"},
@@ -142,26 +143,21 @@ nominal_values = read_nominal_values(
 nominal_values.update(material.get_values_as_dict())
 
 # %%
-# The reference samples are then defined from the csv file containing the measured data.
+# The reference samples are then defined from the measured data.
 # First, the data are filtered to retain only the considered batch:
-df = read_csv(
-    csv_path,
-    delimiter=SEP,
-)
 df = df[df["batch"] == batch]
-df.to_csv("filtered_reference_data.csv", sep=SEP)
 
 # %%
 # Then the groups to which the measured inputs and measured QoIs belong are defined,
-# and the filtered data is loaded as a GEMSEO ``Dataset``:
+# and the filtered data is converted to a GEMSEO ``Dataset``:
 variable_names_to_group_names = dict.fromkeys(measured_inputs, IODataset.INPUT_GROUP)
 variable_names_to_group_names.update(
     dict.fromkeys(measured_outputs, IODataset.OUTPUT_GROUP)
 )
-validation_dataset = IODataset.from_txt(
-    "filtered_reference_data.csv",
-    header=True,
-    delimiter=SEP,
+measured_names = [name for name in variable_names_to_group_names if name in df]
+validation_dataset = IODataset.from_array(
+    df[measured_names].to_numpy(),
+    variable_names=measured_names,
     variable_names_to_group_names=variable_names_to_group_names,
 )
 
@@ -201,7 +197,7 @@ validation_point_tool.save_results(prefix=f"batch_{batch}")
 # %%
 # The results can be plotted:
 figures = validation_point_tool.plot_results(
-    validation_point_tool.result, "reaction_forces", show=True, save=True
+    validation_point_tool.result, "reaction_forces", show=SHOW, save=True
 )
 
 # %%
@@ -25,7 +25,6 @@ import logging
 
 from gemseo.datasets.io_dataset import IODataset
 
-from vimseo import EXAMPLE_RUNS_DIR_NAME
 from vimseo.api import activate_logger
 from vimseo.api import create_model
 from vimseo.core.model_settings import IntegratedModelSettings
@@ -38,6 +37,8 @@ from vimseo.tools.validation_case.validation_case import (
 from vimseo.tools.validation_case.validation_case import (
     DeterministicValidationCaseSettings,
 )
+from vimseo.utilities.doc.gallery_utils import SHOW
+from vimseo.utilities.doc.gallery_utils import get_run_paths
 
 activate_logger(level=logging.INFO)
 
@@ -50,9 +51,7 @@ model = create_model(
     model_name,
     load_case,
     model_options=IntegratedModelSettings(
-        directory_archive_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/archive/validation_case",
-        directory_scratch_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/scratch/validation_case",
-        cache_file_path=f"../../../{EXAMPLE_RUNS_DIR_NAME}/caches/validation_case/{model_name}_{load_case}.hdf",
+        **get_run_paths("validation_case", model_name, load_case)
     ),
 )
 
@@ -105,6 +104,6 @@ print(validation.result.element_wise_metrics)
 # ``x1`` and ``x3`` with ``x1`` a scalar, and ``x3`` a vector of length 3,
 # the input variables shown in the plots are ``x1``, ``x3[0]``, ``x3[1]``, ``x3[2]``
 validation.plot_results(
-    validation.result, metric_name="RelativeErrorMetric", output_name="y4", show=True
+    validation.result, metric_name="RelativeErrorMetric", output_name="y4", show=SHOW
 )
 validation.save_results()
@@ -23,7 +23,6 @@ from __future__ import annotations
 
 import logging
 
-from vimseo import EXAMPLE_RUNS_DIR_NAME
 from vimseo.api import activate_logger
 from vimseo.api import create_model
 from vimseo.core.model_settings import IntegratedModelSettings
@@ -37,6 +36,8 @@ from vimseo.tools.validation_case.validation_case import (
 from vimseo.tools.validation_case.validation_case import (
     DeterministicValidationCaseSettings,
 )
+from vimseo.utilities.doc.gallery_utils import SHOW
+from vimseo.utilities.doc.gallery_utils import get_run_paths
 
 activate_logger(level=logging.INFO)
 
@@ -48,9 +49,7 @@ model = create_model(
     model_name,
     load_case,
     model_options=IntegratedModelSettings(
-        directory_archive_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/archive/validation_case",
-        directory_scratch_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/scratch/validation_case",
-        cache_file_path=f"../../../{EXAMPLE_RUNS_DIR_NAME}/caches/validation_case/{model_name}_{load_case}.hdf",
+        **get_run_paths("validation_case", model_name, load_case)
     ),
 )
 
@@ -100,7 +99,7 @@ figs = validation_tool.plot_results(
     "RelativeErrorMetric",
     "reaction_forces",
     save=False,
-    show=True,
+    show=SHOW,
 )
 
 # %%
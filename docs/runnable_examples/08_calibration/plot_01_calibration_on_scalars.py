@@ -36,7 +36,6 @@ from matplotlib.pyplot import imshow
 from numpy import asarray
 from numpy import atleast_1d
 
-from vimseo import EXAMPLE_RUNS_DIR_NAME
 from vimseo.api import activate_logger
 from vimseo.api import create_model
 from vimseo.core.model_settings import IntegratedModelSettings
@@ -46,6 +45,8 @@ from vimseo.tools.calibration.calibration_step import CalibrationStep
 from vimseo.tools.calibration.calibration_step import CalibrationStepInputs
 from vimseo.tools.calibration.calibration_step import CalibrationStepSettings
 from vimseo.tools.calibration.input_data import CALIBRATION_INPUT_DATA
+from vimseo.utilities.doc.gallery_utils import SHOW
+from vimseo.utilities.doc.gallery_utils import get_run_paths
 from vimseo.utilities.generate_validation_reference import (
     generate_reference_from_parameter_space,
 )
@@ -98,9 +99,7 @@ model = create_model(
     model_name,
     load_case,
     model_options=IntegratedModelSettings(
-        directory_archive_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/archive/calibration_scalars",
-        directory_scratch_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/scratch/calibration_scalars",
-        cache_file_path=f"../../../{EXAMPLE_RUNS_DIR_NAME}/caches/calibration_scalars/{model_name}_{load_case}_cache.hdf",
+        **get_run_paths("calibration_scalars", model_name, load_case)
     ),
 )
 
@@ -177,7 +176,7 @@ imshow(
 # And specifically for scalar metrics, for each data sample (6 here),
 # a bar plot shows the agreement between
 # the simulated prior, posterior and reference output:
-figures = step.plot_results(step.result, save=False, show=True)
+figures = step.plot_results(step.result, save=False, show=SHOW)
 figures["Cantilever"][f"simulated_versus_reference_{output_name}_bars"]
 
 # %%
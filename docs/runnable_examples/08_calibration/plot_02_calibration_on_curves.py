@@ -29,7 +29,6 @@ from gemseo_calibration.calibrator import CalibrationMetricSettings
 from gemseo_calibration.measures.integrated_measure import CurveScaling
 from numpy import atleast_1d
 
-from vimseo import EXAMPLE_RUNS_DIR_NAME
 from vimseo.api import activate_logger
 from vimseo.api import create_model
 from vimseo.core.model_settings import IntegratedModelSettings
@@ -40,6 +39,8 @@ from vimseo.tools.calibration.calibration_step import CalibrationStep
 from vimseo.tools.calibration.calibration_step import CalibrationStepInputs
 from vimseo.tools.calibration.calibration_step import CalibrationStepSettings
 from vimseo.tools.calibration.input_data import CALIBRATION_INPUT_DATA
+from vimseo.utilities.doc.gallery_utils import SHOW
+from vimseo.utilities.doc.gallery_utils import get_run_paths
 from vimseo.utilities.generate_validation_reference import (
     generate_reference_from_parameter_space,
 )
@@ -89,9 +90,7 @@ model = create_model(
     model_name,
     load_case,
     model_options=IntegratedModelSettings(
-        directory_archive_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/archive/calibration_curves",
-        directory_scratch_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/scratch/calibration_curves",
-        cache_file_path=f"../../../{EXAMPLE_RUNS_DIR_NAME}/caches/calibration_curves/{model_name}_{load_case}_cache.hdf",
+        **get_run_paths("calibration_curves", model_name, load_case)
     ),
 )
 
@@ -135,7 +134,7 @@ step.result.prior_parameters
 
 # %%
 # The outputs can be compared to the reference data, before and after calibration:
-figs = step.plot_results(step.result, show=True, save=False)
+figs = step.plot_results(step.result, show=SHOW, save=False)
 figs["Dummy"]["simulated_versus_reference_curve_y_versus_y_axis"]
 
 # %%
@@ -28,7 +28,6 @@ import logging
 from gemseo_calibration.calibrator import CalibrationMetricSettings
 from numpy import atleast_1d
 
-from vimseo import EXAMPLE_RUNS_DIR_NAME
 from vimseo.api import activate_logger
 from vimseo.api import create_model
 from vimseo.core.model_settings import IntegratedModelSettings
@@ -38,6 +37,8 @@ from vimseo.tools.calibration.calibration_step import CalibrationStep
 from vimseo.tools.calibration.calibration_step import CalibrationStepInputs
 from vimseo.tools.calibration.calibration_step import CalibrationStepSettings
 from vimseo.tools.calibration.input_data import CALIBRATION_INPUT_DATA
+from vimseo.utilities.doc.gallery_utils import SHOW
+from vimseo.utilities.doc.gallery_utils import get_run_paths
 from vimseo.utilities.generate_validation_reference import (
     generate_reference_from_parameter_space,
 )
@@ -111,18 +112,14 @@ model_cantilever = create_model(
     model_name,
     "Cantilever",
     model_options=IntegratedModelSettings(
-        directory_archive_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/archive/calibration_coupled",
-        directory_scratch_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/scratch/calibration_coupled",
-        cache_file_path=f"../../../{EXAMPLE_RUNS_DIR_NAME}/caches/calibration_coupled/{model_name}_Cantilever_cache.hdf",
+        **get_run_paths("calibration_coupled", model_name, "Cantilever")
     ),
 )
 model_three_points = create_model(
     model_name,
     "ThreePoints",
     model_options=IntegratedModelSettings(
-        directory_archive_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/archive/calibration_coupled",
-        directory_scratch_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/scratch/calibration_coupled",
-        cache_file_path=f"../../../{EXAMPLE_RUNS_DIR_NAME}/caches/calibration_coupled/{model_name}_ThreePoints_cache.hdf",
+        **get_run_paths("calibration_coupled", model_name, "ThreePoints")
     ),
 )
 
@@ -174,7 +171,7 @@ step.save_results()
 # %%
 # For scalar metrics, a bar plot shows the agreement between
 # the simulated and reference outputs. for the Cantilever load case:
-figures = step.plot_results(step.result, save=False, show=True)
+figures = step.plot_results(step.result, save=False, show=SHOW)
 figures["Cantilever"][f"simulated_versus_reference_{output_name}_bars"]
 
 # %%
@@ -36,12 +36,13 @@ from __future__ import annotations
 
 import logging
 
-from vimseo import EXAMPLE_RUNS_DIR_NAME
 from vimseo.api import activate_logger
 from vimseo.api import create_model
 from vimseo.core.model_settings import IntegratedModelSettings
 from vimseo.tools.sensitivity.sensitivity import SensitivityTool
 from vimseo.tools.space.space_tool import SpaceTool
+from vimseo.utilities.doc.gallery_utils import SHOW
+from vimseo.utilities.doc.gallery_utils import get_run_paths
 
 activate_logger(level=logging.INFO)
 
@@ -55,9 +56,7 @@ model = create_model(
     model_name,
     load_case,
     model_options=IntegratedModelSettings(
-        directory_archive_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/archive/sensitivity",
-        directory_scratch_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/scratch/sensitivity",
-        cache_file_path=f"../../../{EXAMPLE_RUNS_DIR_NAME}/caches/sensitivity/{model_name}_{load_case}_cache.hdf",
+        **get_run_paths("sensitivity", model_name, load_case)
     ),
 )
 
@@ -136,7 +135,7 @@ print(tool.result)
 fig_sensitivity_reaction_forces = tool.plot_results(
     tool.result,
     output_names=output_names,
-    show=True,
+    show=SHOW,
     save=False,
 )
 
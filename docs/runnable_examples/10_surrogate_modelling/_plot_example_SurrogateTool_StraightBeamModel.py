@@ -43,13 +43,14 @@ import pprint
 from gemseo.post.dataset.scatter_plot_matrix import ScatterMatrix
 from numpy import array
 
-from vimseo import EXAMPLE_RUNS_DIR_NAME
 from vimseo.api import activate_logger
 from vimseo.api import create_model
 from vimseo.core.model_settings import IntegratedModelSettings
 from vimseo.tools.doe.doe import DOETool
 from vimseo.tools.space.space_tool import SpaceTool
 from vimseo.tools.surrogate.surrogate import SurrogateTool
+from vimseo.utilities.doc.gallery_utils import SHOW
+from vimseo.utilities.doc.gallery_utils import get_run_paths
 
 activate_logger(level=logging.INFO)
 
@@ -64,9 +65,7 @@ model = create_model(
     model_name,
     load_case,
     model_options=IntegratedModelSettings(
-        directory_archive_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/archive/surrogate",
-        directory_scratch_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/scratch/surrogate",
-        cache_file_path=f"../../../{EXAMPLE_RUNS_DIR_NAME}/caches/surrogate/{model_name}_{load_case}_cache.hdf",
+        **get_run_paths("surrogate", model_name, load_case)
     ),
 )
 
@@ -122,7 +121,7 @@ print(dataset)
 # The generated dataset can also be plotted in a scatter matrix
 
 scatter_matrix = ScatterMatrix(dataset)
-scatter_matrix.execute(save=False, show=True)
+scatter_matrix.execute(save=False, show=SHOW)
 fig = scatter_matrix.figures[0]
 
 fig
@@ -221,7 +220,7 @@ print(surrogate_tool.result)
 figures = surrogate_tool.plot_results(
     surrogate_tool.result,
     output_names=["reaction_forces"],
-    show=True,
+    show=SHOW,
     save=False,
 )
 
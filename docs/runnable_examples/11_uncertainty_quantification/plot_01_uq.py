@@ -33,13 +33,14 @@ from gemseo.post.dataset.scatter import Scatter
 from matplotlib import pyplot as plt
 from numpy import array
 
-from vimseo import EXAMPLE_RUNS_DIR_NAME
 from vimseo.api import activate_logger
 from vimseo.api import create_model
 from vimseo.core.model_settings import IntegratedModelSettings
 from vimseo.tools.doe.doe import DOETool
 from vimseo.tools.space.space_tool import SpaceTool
 from vimseo.tools.statistics.statistics_tool import StatisticsTool
+from vimseo.utilities.doc.gallery_utils import SHOW
+from vimseo.utilities.doc.gallery_utils import get_run_paths
 
 activate_logger(level=logging.INFO)
 
@@ -48,11 +49,7 @@ load_case = "Cantilever"
 model = create_model(
     model_name,
     load_case,
-    model_options=IntegratedModelSettings(
-        directory_archive_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/archive/uq",
-        directory_scratch_root=f"../../../{EXAMPLE_RUNS_DIR_NAME}/scratch/uq",
-        cache_file_path=f"../../../{EXAMPLE_RUNS_DIR_NAME}/caches/uq/{model_name}_{load_case}_cache.hdf",
-    ),
+    model_options=IntegratedModelSettings(**get_run_paths("uq", model_name, load_case)),
 )
 
 # %%
@@ -182,7 +179,7 @@ scatter_plot = Scatter(
     y="width",
 )
 fig = scatter_plot.execute(
-    show=True,
+    show=SHOW,
     save=False,
     directory_path=space_tool.working_directory,
     file_format="html",
@@ -194,9 +191,10 @@ fig
 # For instance, the :class:`~.SpaceTool` provides a scatter matrix plot
 # where the diagonal blocks represent the histograms of the random variables
 # while the other blocks represents the value of a variable versus another.
-space_tool.plot_results(space_tool.result, save=False, show=True, n_samples=200)
+space_tool.plot_results(space_tool.result, save=False, show=SHOW, n_samples=200)
 # Workaround for HTML rendering, instead of ``show=True``
-plt.show()
+if SHOW:
+    plt.show()
 
 # %%
 # .. seealso::
@@ -276,4 +274,4 @@ print(results)
 
 # %%
 # The fitted synthetic distribution can be plotted.
-statistic_tool.plot_results(results, variable=output_name, save=False, show=True)
+statistic_tool.plot_results(results, variable=output_name, save=False, show=SHOW)
@@ -34,6 +34,7 @@ from vimseo.api import activate_logger
 from vimseo.tools.bayes.bayes_analysis import BayesTool
 from vimseo.tools.bayes.bayes_analysis_result import PosteriorChecks
 from vimseo.tools.statistics.statistics_tool import StatisticsTool
+from vimseo.utilities.doc.gallery_utils import SHOW
 
 random.seed(0)  # noqa: NPY002
 
@@ -151,15 +152,15 @@ analysis_l.result
 # %%
 # Then, we determine the burnin for each MCMC sampling.
 # First for the Normal model:
-analysis_n.plot_burnin(analysis_n.result, save=False, show=True)
+analysis_n.plot_burnin(analysis_n.result, save=False, show=SHOW)
 
 # %%
 # Then, the Weibull Min model:
-analysis_w.plot_burnin(analysis_w.result, save=False, show=True)
+analysis_w.plot_burnin(analysis_w.result, save=False, show=SHOW)
 
 # %%
 # And the Log Normal model:
-analysis_l.plot_burnin(analysis_l.result, save=False, show=True)
+analysis_l.plot_burnin(analysis_l.result, save=False, show=SHOW)
 
 # %%
 # A value of 50 for the burnin
@@ -298,8 +299,8 @@ analysis_l_b.save_results()
 # %%
 # Then,
 # we determine the burnin for each MCMC sampling:
-analysis_w_b.plot_burnin(analysis_w_b.result, save=True, show=True)
-analysis_l_b.plot_burnin(analysis_l_b.result, save=True, show=True)
+analysis_w_b.plot_burnin(analysis_w_b.result, save=True, show=SHOW)
+analysis_l_b.plot_burnin(analysis_l_b.result, save=True, show=SHOW)
 
 # Finally,
 # as earlier,
@@ -55,10 +55,10 @@ class Solver(BaseModel):
     @field_validator("job_executor")
     @classmethod
     def __validate_job_executor(cls, v: str | None) -> str | None:
-        if v and v not in JobExecutorFactory().class_names:
-            msg = (
-                f"{v} does not exist. Available job executors "
-                f"{JobExecutorFactory().class_names}."
-            )
-            raise ValueError(msg)
+        if v:
+            # The factory caches the classes, so that creating it is cheap.
+            class_names = JobExecutorFactory().class_names
+            if v not in class_names:
+                msg = f"{v} does not exist. Available job executors {class_names}."
+                raise ValueError(msg)
         return v
@@ -26,48 +26,67 @@ import yaml
 from vimseo.config.base_configuration_factory import BaseConfigurationFactory
 from vimseo.config.configuration_settings import VimseoSettings
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml.
+    from yaml import SafeLoader
+
 LOGGER = logging.getLogger(__name__)
 
+_CAMEL_CASE_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+"""The positions where an underscore is inserted to convert CamelCase to snake_case."""
+
 
-# Detect plugins to agregate the config from plugins with the vimseo config
-# Temporary done with try.except of plugin imports,
-# until done better with entry points:
 def to_snake_case(camel_case: str) -> str:
     """Convert a CamelCase name to snake_case name."""
-    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
-
-
-# Plugin config:
-
+    return _CAMEL_CASE_BOUNDARY.sub("_", camel_case).lower()
+
+
+def get_configuration() -> VimseoSettings:
+    """Return the global VIMSEO configuration.
+
+    The settings of the plugins are aggregated with the VIMSEO settings.
+    The plugins are detected by the factory through the ``gemseo_plugins`` entry
+    points, so only the declared plugins are imported.
+    The VIMSEO modules use the configuration bound to :data:`._configuration`
+    at import.
+
+    Returns:
+        The global VIMSEO configuration.
+    """
+    factory = BaseConfigurationFactory()
+    plugin_names = list(factory.class_names)
+    plugin_names.remove("BaseConfiguration")
+    plugin_names.remove("VimseoSettings")
+    print("Detected plugins:", plugin_names)
+
+    plugin_settings = {}
+    plugin_config_classes = [VimseoSettings]
+
+    for name in plugin_names:
+        plugin_config_classes.append(factory.get_class(name))
+        local_path = Path.cwd() / f"{name}.yml"
+        print(f"Extend config for plugin {to_snake_case(name).split('_settings')[0]}.")
+        print(f"Config file looked for is: {local_path}.")
+        if not local_path.is_file():
+            print(
+                f"No user config file found for plugin {name}: "
+                "default settings are loaded."
+            )
+            continue
+        content = local_path.read_text(encoding="utf-8")
+        print(f"Config file for plugin {name} found.")
+        try:
+            plugin_settings.update(yaml.load(content, Loader=SafeLoader))
+        except yaml.YAMLError as exc:
+            print(exc)
 
-plugin_names = BaseConfigurationFactory().class_names
-plugin_names.remove("BaseConfiguration")
-plugin_names.remove("VimseoSettings")
-print("Detected plugins:", plugin_names)
+    return type("AllSettings", tuple(plugin_config_classes[::-1]), {})(
+        **plugin_settings
+    )
 
-plugin_settings = {}
-plugin_config_classes = [VimseoSettings]
 
-for name in plugin_names:
-    plugin_config_classes.append(BaseConfigurationFactory().get_class(name))
-    local_path = Path.cwd() / f"{name}.yml"
-    print(f"Extend config for plugin {to_snake_case(name).split('_settings')[0]}.")
-    print(f"Config file looked for is: {local_path}.")
-    if local_path.is_file():
-        print(f"Config file for plugin {name} found.")
-        with Path(local_path).open(encoding="utf-8") as f:
-            try:
-                plugin_settings.update(yaml.safe_load(f))
-            except yaml.YAMLError as exc:
-                print(exc)
-    else:
-        print(
-            f"No user config file found for plugin {name}: default settings are loaded."
-        )
-
-_configuration = type("AllSettings", tuple(plugin_config_classes[::-1]), {})(
-    **plugin_settings
-)
+_configuration = get_configuration()
 """The global VIMSEO configuration.
 
 The feature is described
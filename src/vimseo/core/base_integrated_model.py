@@ -25,7 +25,10 @@ from copy import copy
 from copy import deepcopy
 from dataclasses import asdict
 from datetime import datetime
+from functools import cache
+from functools import lru_cache
 from os import getlogin
+from os import scandir
 from pathlib import Path
 from re import match
 from subprocess import CalledProcessError
@@ -78,6 +81,62 @@ if TYPE_CHECKING:
 LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _read_material_file(file_path: Path, mtime_ns: int) -> Material:
+    """Read a material from a JSON file.
+
+    Args:
+        file_path: The absolute path to the JSON file.
+        mtime_ns: The modification time of the file,
+            so that a modified file is read again.
+
+    Returns:
+        The material.
+    """
+    return Material.from_json(file_path)
+
+
+def read_material(file_path: str | Path) -> Material:
+    """Read a material from a JSON file, parsing each version of the file once.
+
+    Each call returns its own copy of the parsed material,
+    so that modifying it does not affect the other callers.
+
+    Args:
+        file_path: The path to the JSON file.
+
+    Returns:
+        The material.
+    """
+    file_path = Path(file_path).resolve()
+    return deepcopy(_read_material_file(file_path, file_path.stat().st_mtime_ns))
+
+
+@cache
+def _get_git_version() -> str:
+    """Return the git commit of the VIMSEO sources.
+
+    The git subprocess is run once per process, since the commit does not change
+    between the model executions.
+
+    Returns:
+        The git commit, empty if it cannot be determined.
+    """
+    here = str(Path(__file__).parent)
+    try:
+        return (
+            subprocess
+            .check_output(["git", "-C", here, "rev-parse", "HEAD"])
+            .decode("utf-8")
+            .strip()
+        )
+    except CalledProcessError:
+        LOGGER.warning(
+            "Model metadata: git is not available, git commit cannot be determined."
+        )
+        return ""
+
+
 class IntegratedModel(GemseoDisciplineWrapper):
     """A :class:`~.IntegratedModel` provides a consistent way to integrate
     mechanical
@@ -221,7 +280,7 @@ class IntegratedModel(GemseoDisciplineWrapper):
         options = IntegratedModelSettings(**options).model_dump()
         self.name = self.__class__.__name__
         self.__material = (
-            Material.from_json(self.MATERIAL_FILE) if self.MATERIAL_FILE != "" else None
+            read_material(self.MATERIAL_FILE) if self.MATERIAL_FILE != "" else None
         )
         self.__load_case = LoadCaseFactory().create(
             load_case_name, domain=self._LOAD_CASE_DOMAIN
@@ -455,11 +514,13 @@ class IntegratedModel(GemseoDisciplineWrapper):
 
         # Fields
         field_file_names = defaultdict(list)
-        if self.scratch_job_directory not in ["", None]:
-            for f in self.scratch_job_directory.iterdir():
-                for name, field_re in self.FIELDS_FROM_FILE.items():
-                    if match(field_re, f.name):
-                        field_file_names[name].append(f.name)
+        if self.FIELDS_FROM_FILE and self.scratch_job_directory not in ["", None]:
+            # Only the file names are needed: scandir avoids creating Path objects.
+            with scandir(self.scratch_job_directory) as entries:
+                for entry in entries:
+                    for name, field_re in self.FIELDS_FROM_FILE.items():
+                        if match(field_re, entry.name):
+                            field_file_names[name].append(entry.name)
 
         self._archive_manager.add_persistent_file_names([
             file_name
@@ -710,19 +771,7 @@ class IntegratedModel(GemseoDisciplineWrapper):
         else:
             error = output_data_raw[MetaDataNames.error_code][0]
 
-        here = str(Path(__file__).parent)
-        try:
-            vims_git_version = (
-                subprocess
-                .check_output(["git", "-C", here, "rev-parse", "HEAD"])
-                .decode("utf-_8")
-                .strip()
-            )
-        except CalledProcessError:
-            LOGGER.warning(
-                "Model metadata: git is not available, git commit cannot be determined."
-            )
-            vims_git_version = ""
+        vims_git_version = _get_git_version()
         if sys.platform.startswith("win"):
             user = getlogin()
         else:
@@ -16,13 +16,14 @@
 from __future__ import annotations
 
 import logging
-from copy import deepcopy
+from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import ClassVar
 
 import matplotlib.pyplot as plt
 import numpy as np
+from gemseo.core.grammars.json_grammar import JSONGrammar
 from numpy import array
 from numpy import atleast_1d
 from numpy import interp
@@ -42,6 +43,22 @@ if TYPE_CHECKING:
 LOGGER = logging.getLogger(__name__)
 
 
+@cache
+def _get_error_code_grammar() -> JSONGrammar:
+    """Return the grammar of the error code output.
+
+    The schema is inferred from data once and shared between the post-processors.
+
+    Returns:
+        The grammar of the error code output.
+    """
+    grammar = JSONGrammar("ErrorCode")
+    grammar.update_from_data({
+        MetaDataNames.error_code.name: atleast_1d(IntegratedModel._ERROR_CODE_DEFAULT)
+    })
+    return grammar
+
+
 class PostProcessor(ExternalSoftwareComponent):
     """Class defining library of components dedicated to post-processing.
 
@@ -64,12 +81,8 @@ class PostProcessor(ExternalSoftwareComponent):
         load_case = options.pop("load_case") if "load_case" in options else None
         super().__init__(**options)
 
-        self._output_physical_var_names = deepcopy(self.output_grammar.names)
-        self.output_grammar.update_from_data({
-            MetaDataNames.error_code.name: atleast_1d(
-                IntegratedModel._ERROR_CODE_DEFAULT
-            )
-        })
+        self._output_physical_var_names = list(self.output_grammar.names)
+        self.output_grammar.update(_get_error_code_grammar())
         self._load_case = load_case
 
     def _run(self, input_data):
@@ -18,7 +18,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from vimseo.core.components.external_software_component import ExternalSoftwareComponent
-from vimseo.job_executor.base_executor import BaseJobExecutor
 from vimseo.job_executor.base_user_job_options import BaseUserJobSettings
 
 if TYPE_CHECKING:
@@ -41,7 +40,6 @@ class RunProcessor(ExternalSoftwareComponent):
         """
         super().__init__(**options)
         self.subroutine_list = []
-        self._job_executor = BaseJobExecutor("")
         self._user_job_options = BaseUserJobSettings()
 
     @property
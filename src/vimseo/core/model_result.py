@@ -34,8 +34,13 @@ from vimseo.storage_management.directory_storage import DirectoryArchive
 from vimseo.tools.base_result import BaseResult
 from vimseo.utilities.curves import Curve
 from vimseo.utilities.fields import Field
+from vimseo.utilities.fields import FieldSeries
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import DTypeLike
+
     from vimseo.core.base_integrated_model import IntegratedModel
     from vimseo.storage_management.base_archive_storage import ModelDataType
 
@@ -64,8 +69,21 @@ class ModelResult(BaseResult):
         model_data: ModelDataType,
         model: IntegratedModel | None = None,
         load_fields: bool = False,
+        field_dtype: DTypeLike | None = None,
     ) -> ModelResult:
-        """Create a ModelResult from raw model data."""
+        """Create a ModelResult from raw model data.
+
+        Args:
+            model_data: The model data.
+            model: The model. If ``None``, create it from the metadata.
+            load_fields: Whether to load the fields from their files.
+            field_dtype: The data type of the floating-point data of the loaded
+                fields, e.g. ``float32`` to reduce the memory footprint for plotting.
+                If ``None``, keep the data type of the files.
+
+        Returns:
+            The model result.
+        """
 
         archive_manager = DirectoryArchive(
             PersistencyPolicy.DELETE_ALWAYS,
@@ -110,7 +128,8 @@ class ModelResult(BaseResult):
                                 MetaDataNames.directory_archive_job
                             ]
                         )
-                        / file_name
+                        / file_name,
+                        dtype=field_dtype,
                     )
                     if load_fields
                     else file_name
@@ -128,6 +147,31 @@ class ModelResult(BaseResult):
             return []
         return curves[0]
 
+    def get_field_series(
+        self, field_name: str, variable_names: Sequence[str] = ()
+    ) -> FieldSeries:
+        """Return the loaded fields of a field variable as a series.
+
+        Args:
+            field_name: The name of the field variable.
+            variable_names: The names of the scalar point variables to store.
+                If empty, use the scalar point variables of the first field.
+
+        Returns:
+            The series of fields.
+
+        Raises:
+            ValueError: When the fields are not loaded.
+        """
+        fields = self.fields[field_name]
+        if not all(isinstance(field_, Field) for field_ in fields):
+            msg = (
+                f"The fields {field_name!r} are not loaded; "
+                "create the result with load_fields=True."
+            )
+            raise ValueError(msg)
+        return FieldSeries.from_fields(fields, variable_names)
+
     def get_numeric_scalars(
         self, variable_names: Iterable[str] = ()
     ) -> Mapping[str, Number]:
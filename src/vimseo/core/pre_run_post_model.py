@@ -21,13 +21,13 @@ from typing import TYPE_CHECKING
 from typing import ClassVar
 
 from vimseo.core.base_integrated_model import IntegratedModel
+from vimseo.core.base_integrated_model import read_material
 from vimseo.core.components.component_factory import ComponentFactory
 from vimseo.core.components.subroutines.subroutine_wrapper_factory import (
     SubroutineWrapperFactory,
 )
 from vimseo.core.load_case_factory import LoadCaseFactory
 from vimseo.core.model_settings import IntegratedModelSettings
-from vimseo.material.material import Material
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -84,7 +84,7 @@ class PreRunPostModel(IntegratedModel):
 
         options = IntegratedModelSettings(**options).model_dump()
         material = (
-            Material.from_json(self.MATERIAL_FILE) if self.MATERIAL_FILE != "" else None
+            read_material(self.MATERIAL_FILE) if self.MATERIAL_FILE != "" else None
         )
 
         component_factory = ComponentFactory()
@@ -95,11 +95,12 @@ class PreRunPostModel(IntegratedModel):
             material=material,
             check_subprocess=options["check_subprocess"],
         )
-        self._subroutine_names = deepcopy(self.SUBROUTINES_NAMES)
-        for sub_name in self._subroutine_names:
-            run_processor.subroutine_list.append(
-                SubroutineWrapperFactory().create(sub_name)
-            )
+        self._subroutine_names = tuple(self.SUBROUTINES_NAMES)
+        subroutine_wrapper_factory = SubroutineWrapperFactory()
+        run_processor.subroutine_list.extend(
+            subroutine_wrapper_factory.create(sub_name)
+            for sub_name in self._subroutine_names
+        )
 
         load_case = LoadCaseFactory().create(
             load_case_name, domain=self._LOAD_CASE_DOMAIN
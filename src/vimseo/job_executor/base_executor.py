@@ -19,9 +19,11 @@ from __future__ import annotations
 
 import logging
 import select
+import shlex
 import subprocess
 import sys
 import time
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import ClassVar
@@ -39,6 +41,51 @@ if TYPE_CHECKING:
 
 LOGGER = logging.getLogger(__name__)
 
+_JINJA_ENVIRONMENT = jinja2.Environment()
+"""The Jinja environment compiling the command templates."""
+
+
+@lru_cache(maxsize=128)
+def _compile_template(template: str) -> jinja2.Template:
+    """Compile a Jinja template, once per template string.
+
+    Args:
+        template: The template string.
+
+    Returns:
+        The compiled template.
+    """
+    return _JINJA_ENVIRONMENT.from_string(template)
+
+
+def _split_command_line(command_line: str) -> list[str]:
+    """Split a command line into arguments.
+
+    The arguments are separated by whitespace,
+    except inside double quotes, which are removed.
+    The single quotes and the backslashes are kept as is,
+    so that the same arguments are obtained on all the platforms.
+
+    Args:
+        command_line: The command line.
+
+    Returns:
+        The arguments of the command line.
+
+    Raises:
+        ValueError: When a double quote is not closed.
+    """
+    lexer = shlex.shlex(command_line, posix=True)
+    lexer.whitespace_split = True
+    lexer.commenters = ""
+    lexer.quotes = '"'
+    lexer.escape = ""
+    try:
+        return list(lexer)
+    except ValueError:
+        msg = f"The command line has an unclosed double quote: {command_line}"
+        raise ValueError(msg) from None
+
 
 class BaseJobExecutor(metaclass=GoogleDocstringInheritanceMeta):
     """A base job executor."""
@@ -109,7 +156,7 @@ class BaseJobExecutor(metaclass=GoogleDocstringInheritanceMeta):
         """
         self._command_line = self._replace_in_command_line(self._command_template)
         return self._execute_external_software(
-            self._command_line.split(), check_subprocess
+            _split_command_line(self._command_line), check_subprocess
         )
 
     def set_options(self, options: BaseUserJobSettings):
@@ -146,10 +193,7 @@ class BaseJobExecutor(metaclass=GoogleDocstringInheritanceMeta):
             to the value that should be placed instead.
         Returns: The formatted string.
         """
-        environment = jinja2.Environment()
-        template_jinja = environment.from_string(template)
-
-        return template_jinja.render(**substitution_dict)
+        return _compile_template(template).render(**substitution_dict)
 
     def _replace_in_command_line(self, template_command: str) -> str:
         """Generates the command line that will launch the RUN Abaqus subprocess.
@@ -187,14 +231,23 @@ class BaseJobExecutor(metaclass=GoogleDocstringInheritanceMeta):
 
         Returns: The error code.
         """
-        if self._is_blocking_subprocess or sys.platform.startswith("win"):
-            return subprocess.run(cmd, cwd=self._job_directory).returncode
+        # On POSIX systems, the file descriptors are non-inheritable by default
+        # (PEP 446), so they need not be closed in the child process,
+        # which allows Python to spawn it without the close_fds sweep.
+        # On Windows, close_fds=False would make the child inherit the handles.
+        is_windows = sys.platform.startswith("win")
+        if self._is_blocking_subprocess or is_windows:
+            return subprocess.run(
+                cmd, cwd=self._job_directory, close_fds=is_windows
+            ).returncode
         proc = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             cwd=self._job_directory,
             text=True,
+            # This branch only runs on POSIX systems.
+            close_fds=False,
         )
         self._convergence_log_length = 0
         while True:
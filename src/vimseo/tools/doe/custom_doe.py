@@ -47,7 +47,7 @@ if TYPE_CHECKING:
 LOGGER = logging.getLogger(__name__)
 
 
-class CustomDOESettings(BaseSettings):
+class BaseCustomDOESettings(BaseSettings):
     input_names: list[str] = Field(
         default=[],
         description="The names of the variables defining the input variables on which "
@@ -61,6 +61,14 @@ class CustomDOESettings(BaseSettings):
     )
 
 
+class CustomDOESettings(BaseCustomDOESettings):
+    n_processes: int = Field(
+        default=1,
+        ge=1,
+        description="The number of processes used to evaluate the samples in parallel.",
+    )
+
+
 class CustomDOEInputs(BaseInputs):
     model: IntegratedModel | None = None
     input_dataset: Dataset | None = Field(
@@ -114,14 +122,13 @@ class CustomDOETool(BaseAnalysisTool):
             if len(options["input_names"]) == 0
             else options["input_names"]
         )
-        if not set(input_names).issubset(set(model.get_input_data_names())):
+        model_input_names = set(model.get_input_data_names())
+        if not model_input_names.issuperset(input_names):
             LOGGER.warning(
                 "Some of the specified input names are not "
-                f"input variables of the model: {set(input_names) - set(model.get_input_data_names())}. "
+                f"input variables of the model: {set(input_names) - model_input_names}. "
             )
-            input_names = [
-                name for name in input_names if name in model.get_input_data_names()
-            ]
+            input_names = [name for name in input_names if name in model_input_names]
 
         output_names = _set_output_names(model, options["output_names"])
 
@@ -142,6 +149,10 @@ class CustomDOETool(BaseAnalysisTool):
                 scenario.add_observable(name)
 
         samples = input_dataset.get_view(variable_names=input_names).to_numpy()
-        scenario.execute(algo_name="CustomDOE", samples=samples)
+        scenario.execute(
+            algo_name="CustomDOE",
+            samples=samples,
+            n_processes=options["n_processes"],
+        )
         self.result.dataset = scenario.to_dataset(name=doe_name, opt_naming=False)
         return self.result
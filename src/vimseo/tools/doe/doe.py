@@ -70,6 +70,11 @@ class DOESettings(BaseSettings):
         description="The name of the DOE algo. "
         "See from gemseo.api.get_available_doe_algorithms().",
     )
+    n_processes: int = Field(
+        default=1,
+        ge=1,
+        description="The number of processes used to evaluate the samples in parallel.",
+    )
     # algo_options: dict | None = Field(
     #     default=None,
     #     description="The options of the DOE algo "
@@ -148,6 +153,7 @@ class DOETool(BaseAnalysisTool):
         doe_scenario.execute(
             algo_name=options["algo"],
             n_samples=options["n_samples"],
+            n_processes=options["n_processes"],
         )
 
         self.result.dataset = doe_scenario.formulation.optimization_problem.to_dataset(
@@ -15,6 +15,7 @@
 
 from __future__ import annotations
 
+import logging
 from collections import OrderedDict
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -44,6 +45,8 @@ if TYPE_CHECKING:
     from pandas import DataFrame
     from plotly.graph_objs import Figure
 
+LOGGER = logging.getLogger(__name__)
+
 
 class StatisticsInputs(BaseInputs):
     dataset: Dataset | None = None
@@ -270,7 +273,7 @@ class StatisticsTool(BaseTool):
                     AttributeError,
                     ImportError,
                 ) as e:
-                    print(e)
+                    LOGGER.debug("Statistic %s cannot be computed: %s", func_name, e)
 
         return pd.DataFrame.from_dict(results) if as_df else results
 
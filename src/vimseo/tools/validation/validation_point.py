@@ -242,6 +242,7 @@ class StochasticValidationPoint(BaseAnalysisTool):
                 output_names=measured_output_names,
                 n_samples=options["n_samples"],
                 algo=options["algo"],
+                n_processes=options["n_processes"],
                 # algo_options=options["algo_options"],
             )
             .dataset
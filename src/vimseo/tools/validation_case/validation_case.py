@@ -45,7 +45,7 @@ from vimseo.tools.post_tools.predict_vs_true_plot import PredictVsTrue
 from vimseo.tools.validation_case.validation_case_result import (
     DeterministicValidationCaseResult,
 )
-from vimseo.tools.verification.base_verification import BaseCodeVerificationSettings
+from vimseo.tools.verification.base_verification import BaseVerificationSettings
 from vimseo.utilities.datasets import dataset_to_dataframe
 from vimseo.utilities.datasets import encode_vector
 
@@ -56,7 +56,7 @@ if TYPE_CHECKING:
     from plotly.graph_objs import Figure
 
 
-class DeterministicValidationCaseSettings(BaseCodeVerificationSettings):
+class DeterministicValidationCaseSettings(BaseVerificationSettings):
     model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
 
     output_names: list[str] = Field(
@@ -202,8 +202,9 @@ class DeterministicValidationCase(BaseAnalysisTool):
         )
         # Each metric is applied to all output_names
         self.result.integrated_metrics = defaultdict(dict)
+        metric_factory = MetricFactory()
         for metric_name in options["metric_names"]:
-            metric = MetricFactory().create(metric_name)
+            metric = metric_factory.create(metric_name)
             dm = DatasetMetric(
                 metric,
                 variable_names=output_names,
@@ -220,7 +221,7 @@ class DeterministicValidationCase(BaseAnalysisTool):
                     metric,
                     variable_names=output_name,
                 )
-                mean_metric = MetricFactory().create("MeanMetric", dm)
+                mean_metric = metric_factory.create("MeanMetric", dm)
                 self.result.integrated_metrics[metric_name][output_name] = (
                     mean_metric.compute(
                         doe_dataset,
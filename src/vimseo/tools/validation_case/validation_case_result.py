@@ -19,8 +19,10 @@ import logging
 from collections import defaultdict
 from dataclasses import dataclass
 from dataclasses import field
+from sys import maxsize
 from typing import TYPE_CHECKING
 
+from numpy import array2string
 from numpy import ndarray
 from pandas import DataFrame
 
@@ -56,8 +58,11 @@ class StochasticValidationCaseResult(BaseResult):
             for name, value in result.nominal_data.items():
                 # data is then converted to dataframe.
                 # arrays are stringified because they could be of different lengths
+                # and are neither summarized nor wrapped.
                 if isinstance(value, ndarray) and value.size > 1:
-                    value = str(value)
+                    value = array2string(
+                        value, max_line_width=maxsize, threshold=maxsize
+                    )
                 data[name].append(value)
             for name, value in result.integrated_metrics[metric_name].items():
                 data[f"{metric_name}[{name}]"].append(value)
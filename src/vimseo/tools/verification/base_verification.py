@@ -33,6 +33,7 @@ from pydantic import Field
 from vimseo.config.global_configuration import _configuration as config
 from vimseo.core.model_metadata import MetaDataNames
 from vimseo.tools.base_analysis_tool import BaseAnalysisTool
+from vimseo.tools.doe.custom_doe import BaseCustomDOESettings
 from vimseo.tools.doe.custom_doe import CustomDOESettings
 from vimseo.tools.post_tools.verification_plots import ErrorMetricHistogram
 from vimseo.tools.verification.verification_result import CASE_DESCRIPTION_TYPE
@@ -133,7 +134,7 @@ def check_output_names(output_names, model) -> None:
         )
 
 
-class BaseCodeVerificationSettings(CustomDOESettings):
+class BaseVerificationSettings(BaseCustomDOESettings):
     metric_names: list[str] = Field(
         default=["SquaredErrorMetric", "RelativeErrorMetric", "AbsoluteErrorMetric"],
         description="The default metric that applies to all model output variables.",
@@ -141,6 +142,10 @@ class BaseCodeVerificationSettings(CustomDOESettings):
     description: CASE_DESCRIPTION_TYPE | None = None
 
 
+class BaseCodeVerificationSettings(BaseVerificationSettings, CustomDOESettings):
+    """The settings of the verifications evaluating the model with a custom DOE."""
+
+
 class BaseVerification(BaseAnalysisTool):
     """A base class to implement code verification."""
 
@@ -192,8 +197,9 @@ class BaseVerification(BaseAnalysisTool):
         # Each metric is applied to all output_names
         integrated_metrics = {}
         error_dataset = Dataset()
+        metric_factory = MetricFactory()
         for metric_name in self.options["metric_names"]:
-            metric = MetricFactory().create(metric_name)
+            metric = metric_factory.create(metric_name)
             dm = DatasetMetric(
                 metric,
                 variable_names=self._output_names,
@@ -211,7 +217,7 @@ class BaseVerification(BaseAnalysisTool):
                     metric,
                     variable_names=output_name,
                 )
-                mean_metric = MetricFactory().create("MeanMetric", dm)
+                mean_metric = metric_factory.create("MeanMetric", dm)
                 integrated_metrics[metric_name][output_name] = mean_metric.compute(
                     doe_dataset,
                     reference_data,
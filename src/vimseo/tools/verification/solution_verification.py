@@ -294,6 +294,7 @@ class DiscretizationSolutionVerification(BaseVerification):
                 model=model,
                 input_dataset=input_dataset,
                 output_names=output_names,
+                n_processes=options["n_processes"],
             ).dataset
             nb_meshes = self.__NB_MESHES
         else:
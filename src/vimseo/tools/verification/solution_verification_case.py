@@ -23,6 +23,7 @@ from typing import TYPE_CHECKING
 from gemseo.datasets.dataset import Dataset
 from gemseo.utils.directory_creator import DirectoryNamingMethod
 from numpy import array
+from numpy import concatenate
 from pandas import DataFrame
 from pydantic import ConfigDict
 from pydantic import Field
@@ -107,7 +108,7 @@ class SolutionVerificationCase(BaseAnalysisTool):
                 for cross_validation in result["cross_validation"].values()
             ]
             for name in variable_names:
-                simulated_values[name] += list(
+                simulated_values[name].append(
                     result["simulation_and_reference"]
                     .get_view(variable_names=name)
                     .to_numpy()
@@ -116,8 +117,8 @@ class SolutionVerificationCase(BaseAnalysisTool):
 
         data = {"extrapolated_values_folds": array(extrapolated_values_folds).flatten()}
         for name in variable_names:
-            data.update({name: array(simulated_values[name]).flatten()})
-        df = DataFrame.from_dict(data)
+            data[name] = concatenate(simulated_values[name])
+        df = DataFrame(data, copy=False)
 
         self.result.convergence_data = df
 
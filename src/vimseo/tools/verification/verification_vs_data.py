@@ -100,6 +100,7 @@ class CodeVerificationAgainstData(BaseVerification):
                 input_dataset=reference_data,
                 input_names=input_names,
                 output_names=self.get_extended_output_names(),
+                n_processes=options["n_processes"],
             )
             .dataset
         )
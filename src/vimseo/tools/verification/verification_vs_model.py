@@ -102,6 +102,7 @@ class CodeVerificationAgainstModel(BaseVerification):
                 # TODO a method get_extended_output_names(),
                 #  to be used in DOE on model in all comparison tools
                 output_names=self.get_extended_output_names(),
+                n_processes=options["n_processes"],
             )
             .dataset
         )
@@ -112,6 +113,7 @@ class CodeVerificationAgainstModel(BaseVerification):
                 model=reference_model,
                 input_dataset=input_dataset,
                 output_names=self._output_names,
+                n_processes=options["n_processes"],
             )
             .dataset
         )
@@ -108,6 +108,7 @@ class CodeVerificationAgainstModelFromParameterSpace(BaseVerification):
                 output_names=self.get_extended_output_names(),
                 n_samples=options["n_samples"],
                 algo=options["algo"],
+                n_processes=options["n_processes"],
                 # algo_options=options["algo_options"],
             )
             .dataset
@@ -121,6 +122,7 @@ class CodeVerificationAgainstModelFromParameterSpace(BaseVerification):
                 output_names=self._output_names,
                 n_samples=options["n_samples"],
                 algo=options["algo"],
+                n_processes=options["n_processes"],
                 # algo_options=options["algo_options"],
             )
             .dataset
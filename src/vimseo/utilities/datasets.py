@@ -293,10 +293,11 @@ def dataset_to_dataframe(
             final_names.append(new_name)
 
     view = ds.get_view(group_names=group_names, variable_names=final_names)
-    df = view.copy()
+    # Building the DataFrame from the view keeps the column dtypes
+    # without the element-wise round trip through a dictionary.
+    df = DataFrame(view, copy=True)
     df.columns = view.get_columns(as_tuple=False)
-    df_as_dict = df.to_dict()
-    return DataFrame.from_dict(df_as_dict)
+    return df
 
 
 def dataframe_to_dataset(df: DataFrame) -> Dataset:
@@ -0,0 +1,61 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""Utilities shared by the runnable examples of the documentation gallery."""
+
+from __future__ import annotations
+
+import os
+
+from vimseo import EXAMPLE_RUNS_DIR_NAME
+
+SHOW = os.environ.get("VIMSEO_GALLERY_SHOW", "1") == "1"
+"""Whether the examples show the figures in blocking viewers.
+
+Set the environment variable ``VIMSEO_GALLERY_SHOW`` to ``0`` to build the gallery
+headlessly.
+"""
+
+EXAMPLE_RUNS_DIR = f"../../../{EXAMPLE_RUNS_DIR_NAME}"
+"""The root directory of the example runs, relative to the directory of the examples."""
+
+
+def get_run_paths(
+    subdir: str, model_name: str = "", load_case: str = ""
+) -> dict[str, str]:
+    """Return the paths of the runs of a model executed by an example.
+
+    The archive, scratch and cache paths are placed under ``subdir`` in
+    :data:`.EXAMPLE_RUNS_DIR`.
+
+    Args:
+        subdir: The name of the subdirectory of the example runs.
+        model_name: The name of the model.
+            If empty, no cache file is used.
+        load_case: The name of the load case.
+            If empty, no cache file is used.
+
+    Returns:
+        The paths, as settings of :class:`.IntegratedModelSettings`.
+    """
+    paths = {
+        "directory_archive_root": f"{EXAMPLE_RUNS_DIR}/archive/{subdir}",
+        "directory_scratch_root": f"{EXAMPLE_RUNS_DIR}/scratch/{subdir}",
+    }
+    if model_name and load_case:
+        paths["cache_file_path"] = (
+            f"{EXAMPLE_RUNS_DIR}/caches/{subdir}/{model_name}_{load_case}_cache.hdf"
+        )
+    return paths
@@ -19,12 +19,34 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from meshio import read
+from numpy import column_stack
+from numpy import floating
+from numpy import issubdtype
+from numpy import stack
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
+    from collections.abc import Sequence
     from pathlib import Path
 
     from numpy import ndarray
+    from numpy.typing import DTypeLike
+
+
+def _cast_values(values: ndarray, dtype: DTypeLike | None) -> ndarray:
+    """Cast the floating-point values to a data type.
+
+    Args:
+        values: The values.
+        dtype: The data type of the floating-point values.
+            If ``None``, keep the data type of the values.
+
+    Returns:
+        The cast values.
+    """
+    if dtype is not None and issubdtype(values.dtype, floating):
+        return values.astype(dtype, copy=False)
+    return values
 
 
 @dataclass
@@ -46,12 +68,148 @@ class Field:
         return list(self.point_data.keys())
 
     @classmethod
-    def load(cls, path: Path | str):
-        field = read(path)
+    def load(cls, path: Path | str, dtype: DTypeLike | None = None):
+        """Load a field from a file.
+
+        Args:
+            path: The path of the file.
+            dtype: The data type of the floating-point point and cell data,
+                e.g. ``float32`` to reduce the memory footprint for plotting.
+                If ``None``, keep the data type of the file.
+
+        Returns:
+            The field.
+        """
+        mesh = read(path)
         return cls(
             path=path,
-            point_data=field.point_data,
-            cell_data=field.cell_data,
-            mesh_points=field.points,
-            mesh_cells=field.cells,
+            point_data={
+                name: _cast_values(values, dtype)
+                for name, values in mesh.point_data.items()
+            },
+            cell_data={
+                name: [_cast_values(block_values, dtype) for block_values in values]
+                for name, values in mesh.cell_data.items()
+            },
+            mesh_points=mesh.points,
+            mesh_cells=mesh.cells,
+        )
+
+
+@dataclass
+class FieldSeries:
+    """A series of fields defined on the same mesh.
+
+    The scalar point variables of the fields are stored in a single array
+    of shape ``(n_fields, n_points, n_variables)``,
+    so that the fields can be compared or reduced along the first axis.
+    """
+
+    values: ndarray | None = None
+    """The values of the point variables,
+    of shape ``(n_fields, n_points, n_variables)``."""
+
+    variable_names: Sequence[str] = ()
+    """The names of the point variables, ordered as the last axis of ``values``."""
+
+    mesh_points: ndarray | None = None
+    """The points of the mesh shared by the fields."""
+
+    paths: Sequence[str | Path] = ()
+    """The paths of the field files."""
+
+    def get_values(self, variable_name: str) -> ndarray:
+        """Return the values of a point variable for all the fields.
+
+        Args:
+            variable_name: The name of the point variable.
+
+        Returns:
+            The values of the variable, of shape ``(n_fields, n_points)``.
+        """
+        return self.values[:, :, self.variable_names.index(variable_name)]
+
+    @classmethod
+    def from_fields(
+        cls, fields: Sequence[Field], variable_names: Sequence[str] = ()
+    ) -> FieldSeries:
+        """Create a series from fields defined on the same mesh.
+
+        Args:
+            fields: The fields.
+            variable_names: The names of the scalar point variables to store.
+                If empty, use the scalar point variables of the first field.
+
+        Returns:
+            The series of fields.
+
+        Raises:
+            ValueError: When there is no field,
+                when the fields do not have the same number of points,
+                when a field does not have a point variable
+                or when a point variable is not a scalar.
+        """
+        if not fields:
+            msg = "The series must contain at least one field."
+            raise ValueError(msg)
+
+        n_points = len(fields[0].mesh_points)
+        if any(len(field.mesh_points) != n_points for field in fields):
+            msg = "The fields must be defined on meshes with the same number of points."
+            raise ValueError(msg)
+
+        if not variable_names:
+            variable_names = [
+                name
+                for name, values in fields[0].point_data.items()
+                if values.size == n_points
+            ]
+
+        variable_names = list(variable_names)
+        for field in fields:
+            for name in variable_names:
+                if name not in field.point_data:
+                    msg = f"The field {field.path!r} has no point variable {name!r}."
+                    raise ValueError(msg)
+                if field.point_data[name].size != n_points:
+                    msg = (
+                        f"The point variable {name!r} of the field {field.path!r} "
+                        "is not a scalar."
+                    )
+                    raise ValueError(msg)
+
+        return cls(
+            values=stack([
+                column_stack([
+                    field.point_data[name].reshape(n_points) for name in variable_names
+                ])
+                for field in fields
+            ]),
+            variable_names=variable_names,
+            mesh_points=fields[0].mesh_points,
+            paths=[field.path for field in fields],
+        )
+
+    @classmethod
+    def load(
+        cls,
+        paths: Sequence[str | Path],
+        variable_names: Sequence[str] = (),
+        dtype: DTypeLike | None = None,
+    ) -> FieldSeries:
+        """Load a series of fields defined on the same mesh.
+
+        Args:
+            paths: The paths of the field files.
+            variable_names: The names of the scalar point variables to store.
+                If empty, use the scalar point variables of the first field.
+            dtype: The data type of the floating-point point data,
+                e.g. ``float32`` to reduce the memory footprint for plotting.
+                If ``None``, keep the data type of the files.
+
+        Returns:
+            The series of fields.
+        """
+        return cls.from_fields(
+            [Field.load(path, dtype=dtype) for path in paths], variable_names
         )
@@ -15,7 +15,6 @@
 
 from __future__ import annotations
 
-import glob
 import logging
 import re
 import time
@@ -25,44 +24,55 @@ LOGGER = logging.getLogger(__name__)
 
 WAIT_FILE_TIMEOUT = 10
 
+_WAIT_FILE_INITIAL_INTERVAL = 0.01
+"""The initial interval in seconds between two checks of the file existence."""
+
+_WAIT_FILE_MAX_INTERVAL = 1.0
+"""The maximum interval in seconds between two checks of the file existence."""
+
 
 def wait_for_file(file_path: Path, timeout: float | None = None) -> None:
     """Wait for a file to appear.
 
+    The file existence is checked at intervals growing exponentially
+    from 10 ms up to 1 s,
+    so that a file appearing quickly is detected without a long sleep.
+    The last interval is shortened so that the wait does not exceed the timeout.
+
     Args:
         file_path: The path to the file expected to appear.
+        timeout: The maximum waiting time in seconds.
+            If ``None``, use ``WAIT_FILE_TIMEOUT``.
 
     Raises:
         A ``FileNotFoundError`` if the file is not found after the timeout.
     """
     timeout = WAIT_FILE_TIMEOUT if timeout is None else timeout
-    time_counter = 0
+    start = time.monotonic()
+    interval = _WAIT_FILE_INITIAL_INTERVAL
     while not (file_path).is_file():
-        time.sleep(1)
-        time_counter += 1
-        if time_counter > timeout:
+        remaining_time = timeout - (time.monotonic() - start)
+        if remaining_time <= 0:
             msg = f"File {file_path} was not found after {timeout}s."
             LOGGER.error(msg)
             raise FileNotFoundError(msg)
+        time.sleep(min(interval, remaining_time))
+        interval = min(2 * interval, _WAIT_FILE_MAX_INTERVAL)
 
-    LOGGER.debug(f"File {file_path} was found after {time_counter}s.")
+    LOGGER.debug(f"File {file_path} was found after {time.monotonic() - start:.2f}s.")
 
 
 def load_results(parent_dir_path: str | Path):
     """Load results based on a parent directory.
 
     All paths to ``.pickle`` file extensions found in the subdirectories
-    of the parent directory are returned.
+    of the parent directory are returned, sorted.
     """
-    pattern = Path(parent_dir_path) / "**/*.pickle"
-
-    result_paths = []
-    for file in glob.glob(str(pattern), recursive=True):  # noqa: PTH207
-        file_path = Path(file)
-        if file_path.is_file():
-            result_paths.append(file_path)
-
-    return result_paths
+    return sorted(
+        file_path
+        for file_path in Path(parent_dir_path).glob("**/*.pickle")
+        if file_path.is_file()
+    )
 
 
 def camel_case_to_snake_case(text: str):
@@ -46,6 +46,26 @@ class Bias:
     component: int | Iterable[int] = 0
 
 
+def apply_biases(dataset: Dataset, outputs_to_bias: Mapping[str, Bias]) -> None:
+    """Bias the outputs of a dataset inplace.
+
+    The model outputs can thus be computed once and biased several times,
+    e.g. to generate several batches of reference data from copies of a dataset.
+
+    Args:
+        dataset: The dataset.
+        outputs_to_bias: The biases applied to the output variables.
+    """
+    for output_name, bias in outputs_to_bias.items():
+        components = (
+            [bias.component] if isinstance(bias.component, int) else bias.component
+        )
+        columns = [("outputs", output_name, i) for i in components]
+        dataset.loc[:, columns] = (
+            dataset.loc[:, columns] * bias.mult_factor + bias.shift
+        )
+
+
 def generate_reference_from_dataset(
     model: IntegratedModel,
     input_dataset: Dataset,
@@ -56,10 +76,12 @@ def generate_reference_from_dataset(
     outputs_to_bias: Mapping[str, Bias] | None = None,
     additional_name_to_data: Mapping[str, ndarray] | None = None,
     as_dataset=False,
+    n_processes: int = 1,
 ):
     """Generate artificial experimental data from input data and a model.
 
     Output data can be biased.
+    The samples can be evaluated in parallel by setting ``n_processes``.
     """
     outputs_to_bias = {} if outputs_to_bias is None else outputs_to_bias
     if specific_inputs is not None:
@@ -74,23 +96,11 @@ def generate_reference_from_dataset(
             output_names=(
                 output_names if len(output_names) > 0 else model.get_output_data_names()
             ),
+            n_processes=n_processes,
         )
         .dataset
     )
-    for output_name, bias in outputs_to_bias.items():
-        if isinstance(bias.component, int):
-            dataset.loc[:, ("outputs", output_name, bias.component)] = dataset.loc[
-                :, ("outputs", output_name, bias.component)
-            ].apply(
-                lambda x: x * bias.mult_factor + bias.shift  # noqa: B023
-            )  # noqa: B023
-        else:
-            for i in bias.component:
-                dataset.loc[:, ("outputs", output_name, i)] = dataset.loc[
-                    :, ("outputs", output_name, i)
-                ].apply(
-                    lambda x: x * bias.mult_factor + bias.shift  # noqa: B023
-                )  # noqa: B023
+    apply_biases(dataset, outputs_to_bias)
     if not as_dataset:
         df_ = dataset.copy()
         df_.columns = dataset.get_columns()
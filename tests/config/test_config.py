@@ -15,7 +15,7 @@
 
 from __future__ import annotations
 
-from os import environ
+from typing import Any
 
 import pytest
 from pydantic import ValidationError
@@ -24,40 +24,54 @@ from vimseo.config.global_configuration import VimseoSettings
 from vimseo.config.global_configuration import _configuration as config
 
 
-def test_config_from_env_var():
+@pytest.fixture
+def env_var_settings(monkeypatch) -> VimseoSettings:
+    """The settings with the job executor of the dummy solver set from an environment
+    variable, restored after the test."""
+    monkeypatch.setenv("VIMSEO_SOLVERS__DUMMY__JOB_EXECUTOR", "BaseInteractiveExecutor")
+    return VimseoSettings()
+
+
+def test_config_from_env_var(env_var_settings):
     """Check that configuration can be set from environment variables."""
     job_executor = config.solvers["dummy"].job_executor
     assert not job_executor
-    environ["VIMSEO_SOLVERS__DUMMY__JOB_EXECUTOR"] = "BaseInteractiveExecutor"
-    config_ = VimseoSettings()
     assert (
-        config_.model_dump()["solvers"]["dummy"]["job_executor"]
+        env_var_settings.model_dump()["solvers"]["dummy"]["job_executor"]
         == "BaseInteractiveExecutor"
     )
 
 
-def test_config_set_attr():
+@pytest.fixture(scope="module")
+def base_settings_data() -> dict[str, Any]:
+    """The data of the default settings, read once from the environment."""
+    return VimseoSettings().model_dump()
+
+
+def test_config_set_attr(base_settings_data):
     """Check that configuration can be set from attribute assignment."""
-    job_executor = config.solvers["dummy"].job_executor
+    config_ = VimseoSettings.model_validate(base_settings_data)
+    job_executor = config_.solvers["dummy"].job_executor
     assert not job_executor
-    config.solvers["dummy"].job_executor = "BaseInteractiveExecutor"
+    config_.solvers["dummy"].job_executor = "BaseInteractiveExecutor"
     assert (
-        config.model_dump()["solvers"]["dummy"]["job_executor"]
+        config_.model_dump()["solvers"]["dummy"]["job_executor"]
         == "BaseInteractiveExecutor"
     )
 
 
-def test_config_with_config_file(tmp_wd):
+def test_config_with_config_file(tmp_wd, monkeypatch):
     """Check that configuration can be set from a .env file."""
+    monkeypatch.delenv("VIMSEO_SOLVERS__DUMMY__JOB_EXECUTOR", raising=False)
     with (tmp_wd / ".env").open("w") as f:
         f.write(
             'VIMSEO_SOLVERS__DUMMY2__JOB_EXECUTOR="BaseInteractiveExecutor"\nVIMSEO_SOLVERS__DUMMY__COMMAND=""\nVIMSEO_DATABASE__MODE="Team"\n'
         )
 
-    config = VimseoSettings()
-    assert {"dummy", "dummy2"} == set(config.solvers.keys())
-    assert config.database.mode == "Team"
-    assert config.solvers["dummy2"].job_executor == "BaseInteractiveExecutor"
+    config_ = VimseoSettings(_env_file=tmp_wd / ".env")
+    assert {"dummy", "dummy2"} == set(config_.solvers.keys())
+    assert config_.database.mode == "Team"
+    assert config_.solvers["dummy2"].job_executor == "BaseInteractiveExecutor"
 
 
 def test_config_bad_job_executor(tmp_wd):
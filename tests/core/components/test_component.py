@@ -15,6 +15,8 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import vimseo.problems.mock.mock_component.mock_component as mc
 from vimseo.core.components.component_factory import ComponentFactory
 
@@ -34,3 +36,28 @@ def test_required_input(tmp_wd):
     """Test case where the required input are checked."""
     mpc3 = mc.MockComponent()
     assert mpc3.input_grammar.required_names == {"x1", "x2", "x3"}
+
+
+def test_copy_attached_files(tmp_wd):
+    """Check that the attached files are copied to the job directory, the last one
+    prevailing when several files have the same name."""
+    for directory_name, text in [("a", "first"), ("b", "last")]:
+        Path(directory_name).mkdir()
+        Path(directory_name, "input.txt").write_text(text)
+    Path("a", "other.txt").write_text("other")
+    job_directory = Path("job")
+    job_directory.mkdir()
+    component = mc.MockComponent()
+    component._job_directory = job_directory
+    component.add_attached_files([
+        Path("a", "input.txt"),
+        Path("a", "other.txt"),
+        Path("b", "input.txt"),
+    ])
+    component._copy_attached_files_to_job_directory()
+    assert sorted(path.name for path in job_directory.iterdir()) == [
+        "input.txt",
+        "other.txt",
+    ]
+    assert (job_directory / "input.txt").read_text() == "last"
+    assert (job_directory / "other.txt").read_text() == "other"
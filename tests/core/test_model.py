@@ -180,6 +180,19 @@ def test_with_material_file(tmp_wd):
     assert_allclose(m.run.get_input_data()["E1"], e1_value)
 
 
+def test_material_not_shared(tmp_wd):
+    """Check that two models created from the same material file do not share their
+    material."""
+    model_1 = create_model("MockModelWithMaterial", "LC1")
+    model_2 = create_model("MockModelWithMaterial", "LC1")
+    assert model_1.material is not model_2.material
+    property_1 = model_1.material.material_relations[0].properties[0]
+    property_2 = model_2.material.material_relations[0].properties[0]
+    lower_bound = property_2.lower_bound
+    property_1.lower_bound -= 1.0
+    assert property_2.lower_bound == lower_bound
+
+
 def test_metadata(tmp_wd):
     """Test that internal data (used for metadata) are in the output grammar with correct
     values."""
@@ -19,7 +19,10 @@ import re
 from pathlib import Path
 
 import pytest
+from meshio import write_points_cells
 from numpy import array
+from numpy import float32
+from numpy import float64
 from numpy import linspace
 from numpy.ma.testutils import assert_array_equal
 from pandas import DataFrame
@@ -31,6 +34,7 @@ from vimseo.core.model_result import ModelResult
 from vimseo.core.model_settings import IntegratedModelSettings
 from vimseo.storage_management.base_storage_manager import PersistencyPolicy
 from vimseo.utilities.curves import Curve
+from vimseo.utilities.fields import Field
 from vimseo.utilities.plotting_utils import plot_curves
 
 
@@ -116,3 +120,49 @@ def test_fields(tmp_wd):
             [0.0, 0.0, 1.0],
         ]),
     )
+
+
+
+@pytest.mark.parametrize(
+    ("dtype", "expected_dtype"), [(None, float64), (float32, float32)]
+)
+def test_fields_dtype(tmp_wd, dtype, expected_dtype):
+    """Check that the floating-point data of the loaded fields can be cast."""
+    model = create_model("MockModelFields", "LC1")
+    model.cache = None
+    output_data = model.execute()
+    write_points_cells(
+        Path(output_data[MetaDataNames.directory_archive_job][0])
+        / output_data["pyramid"][0],
+        array([
+            [0.0, 0.0, 0.0],
+            [1.0, 0.0, 0.0],
+            [1.0, 1.0, 0.0],
+            [0.0, 1.0, 0.0],
+            [0.0, 0.0, 1.0],
+        ]),
+        [("pyramid", array([[0, 1, 2, 3, 4]]))],
+        point_data={"u": linspace(0.0, 1.0, 5)},
+    )
+
+    model_data = {"inputs": model.get_input_data(), "outputs": model.get_output_data()}
+    result = ModelResult.from_data(model_data, load_fields=True, field_dtype=dtype)
+    assert result.fields["pyramid"][0].point_data["u"].dtype == expected_dtype
+    assert result.get_field_series("pyramid").values.dtype == expected_dtype
+
+def test_get_field_series():
+    """Check that the loaded fields of a result can be stacked in a series."""
+    fields = [
+        Field(
+            point_data={"u": array([0.0, 1.0]) + offset},
+            mesh_points=array([[0.0, 0.0], [1.0, 0.0]]),
+        )
+        for offset in (0.0, 10.0)
+    ]
+    result = ModelResult(fields={"f": fields, "g": ["g.vtk"]})
+    assert_array_equal(
+        result.get_field_series("f").get_values("u"),
+        array([[0.0, 1.0], [10.0, 11.0]]),
+    )
+    with pytest.raises(ValueError, match=re.escape("The fields 'g' are not loaded")):
+        result.get_field_series("g")
@@ -17,6 +17,8 @@ from __future__ import annotations
 
 import pytest
 from gemseo.datasets.io_dataset import IODataset
+from numpy import float64
+from numpy import int64
 from pandas import DataFrame
 
 from vimseo.io.test_data import IO_DATA_DIR
@@ -101,6 +103,31 @@ def test_io_read_dataframe_with_vectors(tmp_wd, filename):
     )
 
 
+def test_io_read_dataframe_non_numeric_infer_header(tmp_wd):
+    """Check that a Pandas DataFrame with a non-numeric column can be read with the
+    variable names inferred from the header."""
+    DataFrame({
+        "x": [1, 2],
+        "y": [0.5, 1.5],
+        "name": ["a", "b"],
+        "date": ["2024-01-01", "2024-01-02"],
+    }).to_csv("dataframe.csv", sep=SEP, index=False)
+    dataset = ReaderFileDataFrame().execute(file_name="dataframe.csv").dataset
+    assert set(dataset.variable_names) == {"x", "y", "name", "date"}
+    x = dataset.get_view(variable_names="x")
+    assert x.dtypes.tolist() == [int64]
+    assert x.to_numpy().ravel().tolist() == [1, 2]
+    y = dataset.get_view(variable_names="y")
+    assert y.dtypes.tolist() == [float64]
+    assert y.to_numpy().ravel().tolist() == [0.5, 1.5]
+    name = dataset.get_view(variable_names="name")
+    assert name.dtypes.tolist() == [object]
+    assert name.to_numpy().ravel().tolist() == ["a", "b"]
+    date = dataset.get_view(variable_names="date")
+    assert date.dtypes.tolist() == [object]
+    assert date.to_numpy().ravel().tolist() == ["2024-01-01", "2024-01-02"]
+
+
 @pytest.mark.skip(reason="Issue opened in GEMSEO")
 def test_io_read_dataframe_infer_header(tmp_wd):
     """Check that a Pandas DataFrame with vectors can be read."""
@@ -0,0 +1,105 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from vimseo.job_executor.base_executor import BaseJobExecutor
+from vimseo.job_executor.base_job_options import BaseJobSettings
+
+
+class _JobSettings(BaseJobSettings):
+    input_file: str = ""
+    restart: bool = False
+    options: str = ""
+
+
+@pytest.mark.parametrize(
+    ("template", "options", "expected"),
+    [
+        ("run {{ input_file }}", {"input_file": "input.inp"}, ["run", "input.inp"]),
+        (
+            'run "{{ input_file }}"',
+            {"input_file": "my dir/input.inp"},
+            ["run", "my dir/input.inp"],
+        ),
+        (
+            "run  -i={{ input_file }}",
+            {"input_file": "/data/it's/input.inp"},
+            ["run", "-i=/data/it's/input.inp"],
+        ),
+        (
+            'run "{{ input_file }}"',
+            {"input_file": "/data/it's my/input.inp"},
+            ["run", "/data/it's my/input.inp"],
+        ),
+        (
+            "run {{ input_file }}",
+            {"input_file": r"C:\data\input.inp"},
+            ["run", r"C:\data\input.inp"],
+        ),
+        (
+            'run "{{ input_file }}"',
+            {"input_file": r"C:\my data\input.inp"},
+            ["run", r"C:\my data\input.inp"],
+        ),
+        (
+            "run {% if restart %}--restart{% endif %} -np {{ n_cpus }}",
+            {"n_cpus": 2},
+            ["run", "-np", "2"],
+        ),
+        (
+            "run {% if restart %} --restart {% endif %} -np {{ n_cpus }}",
+            {"restart": True},
+            ["run", "--restart", "-np", "1"],
+        ),
+        (
+            "run {% if restart %} --restart {% endif %} -np {{ n_cpus }}",
+            {},
+            ["run", "-np", "1"],
+        ),
+        (
+            "run {{ options }} {{ input_file }}",
+            {"options": "-a -b", "input_file": "input.inp"},
+            ["run", "-a", "-b", "input.inp"],
+        ),
+    ],
+)
+def test_argv(monkeypatch, template, options, expected):
+    """Check the splitting of the rendered command line into arguments."""
+    executor = BaseJobExecutor(template)
+    executor._job_options = _JobSettings(**options)
+    commands = []
+    monkeypatch.setattr(
+        executor,
+        "_execute_external_software",
+        lambda cmd, check_subprocess: commands.append(cmd) or 0,
+    )
+    executor.execute()
+    assert commands == [expected]
+
+
+def test_argv_unclosed_quote():
+    """Check the error raised when the command line has an unclosed double quote."""
+    executor = BaseJobExecutor('run "{{ input_file }}')
+    executor._job_options = _JobSettings(input_file="input.inp")
+    with pytest.raises(
+        ValueError,
+        match=re.escape('The command line has an unclosed double quote: run "input.inp'),
+    ):
+        executor.execute()
@@ -243,3 +243,17 @@ def test_displacement_profile(tmp_wd, load_case, height):
     y_second = np.diff(y_prime) / np.diff(x[:-1])
     y_second_expected = -model.run.m_func(x[1:-1]) / (young_modulus * quadratic_moment)
     assert y_second == pytest.approx(y_second_expected, rel=1e-5)
+
+
+def test_moment_interpolation(tmp_wd):
+    """Check that the bending moment is interpolated on sorted points and that the
+    queries outside the interpolation range raise an error."""
+    run_processor = create_model("BendingTestAnalytical", "Cantilever").run
+    run_processor.build_moment_linear(
+        np.array([1.0, 0.0, 2.0]), np.array([10.0, 0.0, 20.0])
+    )
+    np.testing.assert_allclose(
+        run_processor.m_func(np.array([0.5, 1.5])), np.array([5.0, 15.0])
+    )
+    with pytest.raises(ValueError, match="outside the interpolation range"):
+        run_processor.m_func(2.5)
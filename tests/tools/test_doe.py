@@ -140,6 +140,44 @@ def test_custom_doe(tmp_wd, input_dataset, input_names, output_names):
     )
 
 
+def test_custom_doe_parallel(tmp_wd, input_dataset):
+    """Check that :class:`.CustomDOETool` gives the same outputs in parallel and in
+    serial."""
+    datasets = [
+        CustomDOETool()
+        .execute(
+            model=MockModel("LC2"),
+            input_dataset=input_dataset,
+            n_processes=n_processes,
+        )
+        .dataset
+        for n_processes in (1, 2)
+    ]
+    assert_array_equal(
+        datasets[1].get_view(group_names=IODataset.OUTPUT_GROUP).to_numpy(),
+        datasets[0].get_view(group_names=IODataset.OUTPUT_GROUP).to_numpy(),
+    )
+
+
+def test_doe_parallel(tmp_wd, parameter_space):
+    """Check that :class:`.DOETool` gives the same samples in parallel and in
+    serial."""
+    datasets = [
+        DOETool()
+        .execute(
+            model=MockModel("LC1"),
+            parameter_space=parameter_space,
+            output_names=["y1"],
+            algo="OT_FULLFACT",
+            n_samples=N_SAMPLES,
+            n_processes=n_processes,
+        )
+        .dataset
+        for n_processes in (1, 2)
+    ]
+    assert_array_equal(datasets[1].to_numpy(), datasets[0].to_numpy())
+
+
 def test_opt_lhs_doe(tmp_wd, mock_model_doe):
     """Check DOE from an OPT_LHS sampling."""
 
@@ -18,12 +18,15 @@ from __future__ import annotations
 import pytest
 from gemseo.datasets.io_dataset import IODataset
 from numpy import array
+from numpy import linspace
 from numpy.testing import assert_allclose
+from pydantic import ValidationError
 
 from vimseo.api import create_model
 from vimseo.problems.mock.mock_reference_data import MOCK_REFERENCE_DIR
 from vimseo.tools.io.reader_file_dataframe import ReaderFileDataFrame
 from vimseo.tools.io.reader_file_dataframe import ReaderFileDataFrameSettings
+from vimseo.tools.validation.validation_point_result import ValidationPointResult
 from vimseo.tools.validation_case.validation_case import DeterministicValidationCase
 from vimseo.tools.validation_case.validation_case import (
     DeterministicValidationCaseInputs,
@@ -31,6 +34,9 @@ from vimseo.tools.validation_case.validation_case import (
 from vimseo.tools.validation_case.validation_case import (
     DeterministicValidationCaseSettings,
 )
+from vimseo.tools.validation_case.validation_case_result import (
+    StochasticValidationCaseResult,
+)
 
 
 @pytest.fixture
@@ -111,6 +117,14 @@ def test_end_to_end_deterministic_validation(tmp_wd, reference_data, metric_name
     ] == pytest.approx(0.1287879)
 
 
+def test_deterministic_validation_settings_without_n_processes():
+    """Check that the deterministic validation case, which evaluates the samples
+    serially, has no setting for the number of processes."""
+    assert "n_processes" not in DeterministicValidationCaseSettings.model_fields
+    with pytest.raises(ValidationError):
+        DeterministicValidationCaseSettings(n_processes=2)
+
+
 def test_validation_plots(tmp_wd, reference_data):
     """Check that validation plots are saved on disk."""
     validation_case = DeterministicValidationCase()
@@ -146,33 +160,44 @@ def test_validation_plots(tmp_wd, reference_data):
     assert (validation_case.working_directory / "integrated_metric_bars.html").is_file()
 
 
-# # TODO wait for refactoring of validaiton case tool
-# def test_to_dataframe(tmp_wd):
-#     """Check that a StochasticValidationCaseResult can export a DataFrame containing the
-#     nominal input variables and the integrated metrics as outputs."""
-#     point_1 = ValidationPointResult(
-#         nominal_data={
-#             "x1_vector": linspace(0, 1, 5),
-#             "x2": array([1.0]),
-#             "x3": 2.0,
-#             "x4": "foo",
-#         },
-#         integrated_metrics={"metric1": {"y1": 3.0}},
-#     )
-#     point_2 = ValidationPointResult(
-#         nominal_data={
-#             "x1_vector": linspace(0, 1, 3),
-#             "x2": array([2.0]),
-#             "x3": 3.0,
-#             "x4": "bar",
-#         },
-#         integrated_metrics={"metric1": {"y1": 4.0}},
-#     )
-#     result = StochasticValidationCaseResult(validation_point_results=[point_1, point_2])
-#     df = result.to_dataframe("metric1")
-#     assert list(df["x1_vector"].values) == [
-#         "[0.   0.25 0.5  0.75 1.  ]",
-#         "[0.  0.5 1. ]",
-#     ]
-#     assert df.shape == (2, 5)
-#     assert list(df.columns.values) == ["x1_vector", "x2", "x3", "x4", "metric1[y1]"]
+def test_to_dataframe():
+    """Check that a StochasticValidationCaseResult can export a DataFrame containing the
+    nominal input variables and the integrated metrics as outputs."""
+    point_1 = ValidationPointResult(
+        nominal_data={
+            "x1_vector": linspace(0, 1, 5),
+            "x2": 1.0,
+            "x3": "foo",
+        },
+        integrated_metrics={"metric1": {"y1": 3.0}},
+    )
+    point_2 = ValidationPointResult(
+        nominal_data={
+            "x1_vector": linspace(0, 1, 3),
+            "x2": 2.0,
+            "x3": "bar",
+        },
+        integrated_metrics={"metric1": {"y1": 4.0}},
+    )
+    point_3 = ValidationPointResult(
+        nominal_data={
+            "x1_vector": linspace(0, 1, 3),
+            "x2": 3.0,
+            "x3": "baz",
+        },
+        integrated_metrics={"metric1": {"y1": 5.0}},
+    )
+    result = StochasticValidationCaseResult(
+        validation_point_results=[point_1, point_2, point_3]
+    )
+    df = result.to_dataframe("metric1")
+    assert df.shape == (3, 4)
+    assert list(df.columns.values) == ["x1_vector", "x2", "x3", "metric1[y1]"]
+    assert df["x1_vector"].tolist() == [
+        "[0.   0.25 0.5  0.75 1.  ]",
+        "[0.  0.5 1. ]",
+        "[0.  0.5 1. ]",
+    ]
+    assert df["x2"].tolist() == [1.0, 2.0, 3.0]
+    assert df["x3"].tolist() == ["foo", "bar", "baz"]
+    assert df["metric1[y1]"].tolist() == [3.0, 4.0, 5.0]
@@ -15,6 +15,7 @@
 
 from __future__ import annotations
 
+import pytest
 from gemseo.utils.directory_creator import DirectoryNamingMethod
 from numpy import array
 from numpy import linspace
@@ -29,30 +30,38 @@ from vimseo.tools.verification.solution_verification_case import (
 )
 
 
-def test_solution_verification_case(tmp_wd):
-    y_offset = linspace(0.0, 1.0, 3)
-    results = []
-    for offset in y_offset:
-        verificator = DiscretizationSolutionVerification(
-            directory_naming_method=DirectoryNamingMethod.NUMBERED,
-        )
-        df = DataFrame.from_dict({
-            ("inputs", "h", 0): array([0.5, 0.4, 0.3, 0.2, 0.1]),
-            ("outputs", "a_h", 0): array([1.5, 1.4, 1.3, 1.2, 1.1]) + offset,
-            ("outputs", "y1", 0): ones(5),
-            ("outputs", "cpu_time", 0): linspace(1.0, 2.0, 5),
+@pytest.fixture(scope="module")
+def simulated_data() -> list[DataFrame]:
+    """The simulated data of three convergence studies shifted along the output."""
+    h = array([0.5, 0.4, 0.3, 0.2, 0.1])
+    y1 = ones(5)
+    cpu_time = linspace(1.0, 2.0, 5)
+    a_h = array([1.5, 1.4, 1.3, 1.2, 1.1])[None, :] + linspace(0.0, 1.0, 3)[:, None]
+    return [
+        DataFrame.from_dict({
+            ("inputs", "h", 0): h,
+            ("outputs", "a_h", 0): a_h_i,
+            ("outputs", "y1", 0): y1,
+            ("outputs", "cpu_time", 0): cpu_time,
         })
-        results.append(
-            verificator.execute(
-                element_size_variable_name="h",
-                output_name="a_h",
-                simulated_data=df,
-            )
+        for a_h_i in a_h
+    ]
+
+
+def test_solution_verification_case(tmp_wd, simulated_data):
+    results = [
+        DiscretizationSolutionVerification(
+            directory_naming_method=DirectoryNamingMethod.NUMBERED,
+        ).execute(
+            element_size_variable_name="h",
+            output_name="a_h",
+            simulated_data=df,
         )
+        for df in simulated_data
+    ]
 
     tool = SolutionVerificationCase()
     result = tool.execute(results=results)
     tool.plot_results(result, save=True, show=False)
     assert tool.working_directory / "convergence_case_h_a_h.html"
     assert tool.working_directory / "cpu_time_compromise_a_h.html"
-
@@ -137,3 +137,28 @@ def test_verification_against_model_with_output_names_restriction(
             group_name=IODataset.OUTPUT_GROUP
         )
     ) == {"y1", MetaDataNames.cpu_time, "Ref[y1]"}
+
+
+def test_verification_against_model_parallel(tmp_wd, reference_data):
+    """Check that :class:`.CodeVerificationAgainstModel` gives the same outputs in
+    parallel and in serial."""
+    results = []
+    for n_processes in (1, 2):
+        model = create_model("MockModel", "LC2")
+        model.cache = None
+        model_2 = create_model("MockModel", "LC2")
+        model_2.default_input_data["x1_2"] = atleast_1d(X1_2_VALUE)
+        verificator = CodeVerificationAgainstModel()
+        verificator.execute(
+            model=model,
+            reference_model=model_2,
+            input_dataset=reference_data,
+            output_names=["y1"],
+            n_processes=n_processes,
+        )
+        results.append(verificator.result.simulation_and_reference)
+
+    assert_array_equal(
+        results[1].get_view(variable_names=["y1", "Ref[y1]"]).to_numpy(),
+        results[0].get_view(variable_names=["y1", "Ref[y1]"]).to_numpy(),
+    )
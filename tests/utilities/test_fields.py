@@ -0,0 +1,114 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from __future__ import annotations
+
+import pytest
+from meshio import write_points_cells
+from numpy import array
+from numpy import float32
+from numpy import float64
+from numpy import int64
+from numpy.testing import assert_array_equal
+
+from vimseo.utilities.fields import Field
+from vimseo.utilities.fields import FieldSeries
+
+
+def _create_field(offset: float, n_points: int = 3) -> Field:
+    return Field(
+        point_data={
+            "u": array([0.0, 1.0, 2.0][:n_points]) + offset,
+            "v": array([[3.0], [4.0], [5.0]][:n_points]) + offset,
+        },
+        mesh_points=array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]][:n_points]),
+    )
+
+
+def test_field_series():
+    """Check that fields are stacked in a single array."""
+    series = FieldSeries.from_fields([_create_field(0.0), _create_field(10.0)])
+    assert series.values.shape == (2, 3, 2)
+    assert series.variable_names == ["u", "v"]
+    assert_array_equal(
+        series.get_values("v"), array([[3.0, 4.0, 5.0], [13.0, 14.0, 15.0]])
+    )
+    series = FieldSeries.from_fields(
+        [_create_field(0.0), _create_field(10.0)], variable_names=["u"]
+    )
+    assert_array_equal(series.values[..., 0], series.get_values("u"))
+
+
+def test_field_series_different_meshes():
+    """Check that an error is raised when the meshes have different sizes."""
+    with pytest.raises(ValueError, match="same number of points"):
+        FieldSeries.from_fields([_create_field(0.0), _create_field(0.0, n_points=2)])
+
+
+def test_field_series_no_field():
+    """Check that an error is raised when there is no field."""
+    with pytest.raises(ValueError, match="at least one field"):
+        FieldSeries.from_fields([])
+
+
+def test_field_series_vector_variable():
+    """Check that the vector point variables are skipped by default and rejected
+    otherwise."""
+    fields = [_create_field(0.0), _create_field(10.0)]
+    for field in fields:
+        field.point_data["w"] = array([[0.0, 1.0], [2.0, 3.0], [4.0, 5.0]])
+    assert FieldSeries.from_fields(fields).variable_names == ["u", "v"]
+    with pytest.raises(ValueError, match="point variable 'w'"):
+        FieldSeries.from_fields(fields, variable_names=["u", "w"])
+
+
+
+def test_field_series_missing_variable():
+    """Check that an error is raised when a field does not have a point variable."""
+    fields = [_create_field(0.0), _create_field(10.0)]
+    del fields[1].point_data["v"]
+    with pytest.raises(ValueError, match="has no point variable 'v'"):
+        FieldSeries.from_fields(fields)
+
+_U = array([0.0, 1.0, 2.0])
+
+
+def _write_field(file_path: str, offset: float = 0.0) -> None:
+    write_points_cells(
+        file_path,
+        array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]),
+        [("triangle", array([[0, 1, 2]]))],
+        point_data={
+            "u": _U + offset,
+            "id": array([0, 1, 2], dtype=int64),
+        },
+        cell_data={"s": [array([3.0]) + offset]},
+    )
+
+
+@pytest.mark.parametrize(
+    ("dtype", "expected_dtype"), [(None, float64), (float32, float32)]
+)
+def test_field_load_dtype(tmp_wd, dtype, expected_dtype):
+    """Check that the floating-point data are cast only when a data type is given."""
+    _write_field("field.vtk")
+    field = Field.load("field.vtk", dtype=dtype)
+    assert field.point_data["u"].dtype == expected_dtype
+    assert field.cell_data["s"][0].dtype == expected_dtype
+    assert field.point_data["id"].dtype == int64
+    assert_array_equal(field.point_data["u"], _U)
+    series = FieldSeries.load(["field.vtk"], variable_names=["u"], dtype=dtype)
+    assert series.values.dtype == expected_dtype
+
@@ -0,0 +1,84 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from vimseo.utilities import file_utils
+from vimseo.utilities.file_utils import load_results
+from vimseo.utilities.file_utils import wait_for_file
+
+
+class _FakeTime:
+    """A clock advanced only by the sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, duration: float) -> None:
+        self.sleeps.append(duration)
+        self.now += duration
+
+
+def test_wait_for_file(tmp_wd):
+    """Check that a file appearing during the wait is found."""
+    file_path = Path("file.txt")
+    timer = threading.Timer(0.05, file_path.touch)
+    timer.start()
+    try:
+        wait_for_file(file_path, timeout=5)
+    finally:
+        timer.join()
+    assert file_path.is_file()
+
+
+def test_wait_for_file_timeout(tmp_wd, monkeypatch):
+    """Check that an error is raised once the timeout is reached, without exceeding
+    it."""
+    fake_time = _FakeTime()
+    monkeypatch.setattr(file_utils, "time", fake_time)
+    with pytest.raises(FileNotFoundError, match=r"was not found after 1\.5s"):
+        wait_for_file(Path("file.txt"), timeout=1.5)
+    assert fake_time.sleeps[:3] == pytest.approx([0.01, 0.02, 0.04])
+    assert max(fake_time.sleeps) <= 1.0
+    assert fake_time.now == pytest.approx(1.5)
+
+
+def test_load_results(tmp_wd):
+    """Check that the pickle files of the subdirectories are returned sorted."""
+    for path in [
+        Path("z.pickle"),
+        Path("b", "c", "y.pickle"),
+        Path("a", "x.pickle"),
+        Path("a", "w.pickle"),
+        Path("a", "v.txt"),
+    ]:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    Path("d.pickle").mkdir()
+    assert load_results(".") == [
+        Path("a", "w.pickle"),
+        Path("a", "x.pickle"),
+        Path("b", "c", "y.pickle"),
+        Path("z.pickle"),
+    ]
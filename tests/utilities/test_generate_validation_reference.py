@@ -0,0 +1,67 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from __future__ import annotations
+
+import pytest
+from gemseo.datasets.io_dataset import IODataset
+from numpy import array
+from pandas._testing import assert_frame_equal
+
+from vimseo.utilities.generate_validation_reference import Bias
+from vimseo.utilities.generate_validation_reference import apply_biases
+
+
+@pytest.fixture
+def dataset() -> IODataset:
+    """A dataset with a scalar input ``x`` and the outputs ``y``, of two components,
+    and ``z``."""
+    return IODataset.from_array(
+        data=array([[0.0, 1.0, 2.0, 3.0], [4.0, 5.0, 6.0, 7.0], [8.0, 9.0, 10.0, 11.0]]),
+        variable_names=["x", "y", "z"],
+        variable_names_to_n_components={"y": 2},
+        variable_names_to_group_names={
+            "x": IODataset.INPUT_GROUP,
+            "y": IODataset.OUTPUT_GROUP,
+            "z": IODataset.OUTPUT_GROUP,
+        },
+    )
+
+
+@pytest.mark.parametrize(
+    "outputs_to_bias",
+    [
+        {"z": Bias(mult_factor=1.05)},
+        {"z": Bias(shift=2.0)},
+        {"y": Bias(mult_factor=1.05, shift=-0.5, component=1)},
+        {"y": Bias(mult_factor=0.9, component=[0, 1]), "z": Bias(shift=2.0)},
+    ],
+)
+def test_apply_biases(dataset, outputs_to_bias):
+    """Check that the biases applied on whole columns give the same dataset as the
+    biases applied sample by sample."""
+    expected = dataset.copy()
+    for output_name, bias in outputs_to_bias.items():
+        components = (
+            [bias.component] if isinstance(bias.component, int) else bias.component
+        )
+        for i in components:
+            column = (IODataset.OUTPUT_GROUP, output_name, i)
+            expected.loc[:, column] = expected.loc[:, column].apply(
+                lambda x: x * bias.mult_factor + bias.shift  # noqa: B023
+            )
+
+    apply_biases(dataset, outputs_to_bias)
+    assert_frame_equal(dataset, expected)